@@ -1,9 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from fastmcp import FastMCP
 import asyncio
 import anyio
 import wwise_python_lib as WwisePythonLibrary
 import inspect
+import functools
 import ast
 import logging
 import sys
@@ -43,6 +44,17 @@ def connect_to_wwise() -> None:
     finally:
         loop.close()
 
+def ensure_wwise_connection() -> bool:
+    """Reuse the live WAAPI connection, connecting only if it is missing or dead."""
+    loop = create_asyncio_loop()
+    try: 
+        return WwisePythonLibrary.ensure_connected()
+    except Exception: 
+        logger.exception("Failed to connect to Wwise Client.")
+        raise 
+    finally:
+        loop.close()
+
 def resolve_all_path_relationships_in(parent_path: str) -> list[dict]: 
     if not parent_path: 
         raise ValueError("Please provide a non empty parent path to resolve descendant paths in.")
@@ -81,9 +93,16 @@ def create_child_objects(
         except (KeyError, TypeError) as e:
             raise ValueError("One or more parent objects are missing an 'id' field.") from e
 
-        result : list[dict] = []
-        for parent_id, child_name, child_type in zip(parent_ids, child_names, child_types):
-            result.extend(WwisePythonLibrary.create_object(parent_id, child_name, child_type))
+        # One object.set per distinct parent; results are put back in request order
+        by_parent: dict[str, list[int]] = {}
+        for i, parent_id in enumerate(parent_ids[:min(len(child_names), len(child_types))]):
+            by_parent.setdefault(parent_id, []).append(i)
+
+        result : list[dict] = [None] * sum(map(len, by_parent.values()))
+        for parent_id, indices in by_parent.items():
+            specs = [{"name": child_names[i], "type": child_types[i]} for i in indices]
+            for i, created in zip(indices, WwisePythonLibrary.create_objects(parent_id, specs)):
+                result[i] = created
 
         return result
     
@@ -597,13 +616,20 @@ def toggle_layout(requested_layout: str) -> None:
         logger.exception("Failed to toggle to layout %r", requested_layout)
         raise
 
-def get_all_property_name_valid_values() -> str:
+def get_all_property_name_valid_values(client_etag: str | None = None) -> dict:
     try:
-        return WwisePythonLibrary.get_all_property_name_valid_values() 
+        return WwisePythonLibrary.get_all_property_name_valid_values(client_etag) 
     except Exception: 
         logger.exception("Failed to get all property names and associated valid value ranges.")
         raise
 
+def get_property_help(kind: str) -> str:
+    try:
+        return WwisePythonLibrary.get_property_help(kind)
+    except Exception: 
+        logger.exception("Failed to get property help for %r", kind)
+        raise
+
 # ---- Additional WAAPI command wrappers (pass-through to WwisePythonLibrary) ----
 def _wrap(name: str):
     def f(*a, **k):
@@ -785,39 +811,6 @@ waapi_subscribe = _wrap("waapi_subscribe")
 waapi_unsubscribe = _wrap("waapi_unsubscribe")
 waapi_subscription_events = _wrap("waapi_subscription_events")
 waapi_list_topic_uris = _wrap("waapi_list_topic_uris")
-subscribe_topic_audio_imported = _wrap("subscribe_topic_audio_imported")
-subscribe_topic_log_item_added = _wrap("subscribe_topic_log_item_added")
-subscribe_topic_object_attenuation_curve_changed = _wrap("subscribe_topic_object_attenuation_curve_changed")
-subscribe_topic_object_attenuation_curve_link_changed = _wrap("subscribe_topic_object_attenuation_curve_link_changed")
-subscribe_topic_object_child_added = _wrap("subscribe_topic_object_child_added")
-subscribe_topic_object_child_removed = _wrap("subscribe_topic_object_child_removed")
-subscribe_topic_object_created = _wrap("subscribe_topic_object_created")
-subscribe_topic_object_curve_changed = _wrap("subscribe_topic_object_curve_changed")
-subscribe_topic_object_name_changed = _wrap("subscribe_topic_object_name_changed")
-subscribe_topic_object_notes_changed = _wrap("subscribe_topic_object_notes_changed")
-subscribe_topic_object_post_deleted = _wrap("subscribe_topic_object_post_deleted")
-subscribe_topic_object_pre_deleted = _wrap("subscribe_topic_object_pre_deleted")
-subscribe_topic_object_property_changed = _wrap("subscribe_topic_object_property_changed")
-subscribe_topic_object_reference_changed = _wrap("subscribe_topic_object_reference_changed")
-subscribe_topic_object_structure_changed = _wrap("subscribe_topic_object_structure_changed")
-subscribe_topic_profiler_capture_log_item_added = _wrap("subscribe_topic_profiler_capture_log_item_added")
-subscribe_topic_profiler_game_object_registered = _wrap("subscribe_topic_profiler_game_object_registered")
-subscribe_topic_profiler_game_object_reset = _wrap("subscribe_topic_profiler_game_object_reset")
-subscribe_topic_profiler_game_object_unregistered = _wrap("subscribe_topic_profiler_game_object_unregistered")
-subscribe_topic_profiler_state_changed = _wrap("subscribe_topic_profiler_state_changed")
-subscribe_topic_profiler_switch_changed = _wrap("subscribe_topic_profiler_switch_changed")
-subscribe_topic_project_loaded = _wrap("subscribe_topic_project_loaded")
-subscribe_topic_project_post_closed = _wrap("subscribe_topic_project_post_closed")
-subscribe_topic_project_pre_closed = _wrap("subscribe_topic_project_pre_closed")
-subscribe_topic_project_saved = _wrap("subscribe_topic_project_saved")
-subscribe_topic_soundbank_generated = _wrap("subscribe_topic_soundbank_generated")
-subscribe_topic_soundbank_generation_done = _wrap("subscribe_topic_soundbank_generation_done")
-subscribe_topic_switch_container_assignment_added = _wrap("subscribe_topic_switch_container_assignment_added")
-subscribe_topic_switch_container_assignment_removed = _wrap("subscribe_topic_switch_container_assignment_removed")
-subscribe_topic_transport_state_changed = _wrap("subscribe_topic_transport_state_changed")
-subscribe_topic_debug_assert_failed = _wrap("subscribe_topic_debug_assert_failed")
-subscribe_topic_ui_commands_executed = _wrap("subscribe_topic_ui_commands_executed")
-subscribe_topic_ui_selection_changed = _wrap("subscribe_topic_ui_selection_changed")
 
 #==============================================================================
 #                            Function Dictionary
@@ -827,6 +820,10 @@ subscribe_topic_ui_selection_changed = _wrap("subscribe_topic_ui_selection_chang
 class Command:
     func: callable
     doc: str
+    sig: inspect.Signature = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.sig = inspect.signature(self.func)
 
 COMMANDS: dict[str, Command] = {
     "connect_to_wwise" : Command(
@@ -1015,8 +1012,13 @@ COMMANDS: dict[str, Command] = {
     ),
     "get_all_property_name_and_valid_value_types" : Command(
         func=get_all_property_name_valid_values, 
-        doc ="Return a newline-formatted help string listing the correct WAAPI property identifiers for the specified Wwise object type."
-             "Args: None. Returns: str."
+        doc ="Return a newline-formatted help string listing the correct WAAPI property identifiers for the specified Wwise object type. "
+             "Args: client_etag : str | None (etag from a previous call). Returns: {etag : str, body : str}; body is empty if client_etag is current."
+    ),
+    "get_property_help" : Command(
+        func=get_property_help, 
+        doc ="Return the WAAPI property identifiers and valid values for one object kind only (smaller than the full listing). "
+             "Args: kind : str (RandomContainer, Attenuation or Sound). Returns: str."
     ),
     # Additional WAAPI commands
     "soundengine_get_state": Command(func=soundengine_get_state, doc="Get current state of a State Group. Args: state_group."),
@@ -1171,41 +1173,17 @@ COMMANDS: dict[str, Command] = {
     "waapi_unsubscribe": Command(func=waapi_unsubscribe, doc="Unsubscribe by subscription_id. Args: subscription_id. Returns bool."),
     "waapi_subscription_events": Command(func=waapi_subscription_events, doc="Get events for a subscription. Args: subscription_id, max_count=None, clear=True. Returns list of event dicts."),
     "waapi_list_topic_uris": Command(func=waapi_list_topic_uris, doc="Return list of WAAPI topic URIs from reference. Args: None."),
-    "subscribe_topic_audio_imported": Command(func=subscribe_topic_audio_imported, doc="Subscribe to ak.wwise.core.audio.imported. Returns subscription_id."),
-    "subscribe_topic_log_item_added": Command(func=subscribe_topic_log_item_added, doc="Subscribe to ak.wwise.core.log.itemAdded. Returns subscription_id."),
-    "subscribe_topic_object_attenuation_curve_changed": Command(func=subscribe_topic_object_attenuation_curve_changed, doc="Subscribe to ak.wwise.core.object.attenuationCurveChanged. Returns subscription_id."),
-    "subscribe_topic_object_attenuation_curve_link_changed": Command(func=subscribe_topic_object_attenuation_curve_link_changed, doc="Subscribe to ak.wwise.core.object.attenuationCurveLinkChanged. Returns subscription_id."),
-    "subscribe_topic_object_child_added": Command(func=subscribe_topic_object_child_added, doc="Subscribe to ak.wwise.core.object.childAdded. Returns subscription_id."),
-    "subscribe_topic_object_child_removed": Command(func=subscribe_topic_object_child_removed, doc="Subscribe to ak.wwise.core.object.childRemoved. Returns subscription_id."),
-    "subscribe_topic_object_created": Command(func=subscribe_topic_object_created, doc="Subscribe to ak.wwise.core.object.created. Returns subscription_id."),
-    "subscribe_topic_object_curve_changed": Command(func=subscribe_topic_object_curve_changed, doc="Subscribe to ak.wwise.core.object.curveChanged. Returns subscription_id."),
-    "subscribe_topic_object_name_changed": Command(func=subscribe_topic_object_name_changed, doc="Subscribe to ak.wwise.core.object.nameChanged. Returns subscription_id."),
-    "subscribe_topic_object_notes_changed": Command(func=subscribe_topic_object_notes_changed, doc="Subscribe to ak.wwise.core.object.notesChanged. Returns subscription_id."),
-    "subscribe_topic_object_post_deleted": Command(func=subscribe_topic_object_post_deleted, doc="Subscribe to ak.wwise.core.object.postDeleted. Returns subscription_id."),
-    "subscribe_topic_object_pre_deleted": Command(func=subscribe_topic_object_pre_deleted, doc="Subscribe to ak.wwise.core.object.preDeleted. Returns subscription_id."),
-    "subscribe_topic_object_property_changed": Command(func=subscribe_topic_object_property_changed, doc="Subscribe to ak.wwise.core.object.propertyChanged. Returns subscription_id."),
-    "subscribe_topic_object_reference_changed": Command(func=subscribe_topic_object_reference_changed, doc="Subscribe to ak.wwise.core.object.referenceChanged. Returns subscription_id."),
-    "subscribe_topic_object_structure_changed": Command(func=subscribe_topic_object_structure_changed, doc="Subscribe to ak.wwise.core.object.structureChanged. Returns subscription_id."),
-    "subscribe_topic_profiler_capture_log_item_added": Command(func=subscribe_topic_profiler_capture_log_item_added, doc="Subscribe to ak.wwise.core.profiler.captureLog.itemAdded. Returns subscription_id."),
-    "subscribe_topic_profiler_game_object_registered": Command(func=subscribe_topic_profiler_game_object_registered, doc="Subscribe to ak.wwise.core.profiler.gameObjectRegistered. Returns subscription_id."),
-    "subscribe_topic_profiler_game_object_reset": Command(func=subscribe_topic_profiler_game_object_reset, doc="Subscribe to ak.wwise.core.profiler.gameObjectReset. Returns subscription_id."),
-    "subscribe_topic_profiler_game_object_unregistered": Command(func=subscribe_topic_profiler_game_object_unregistered, doc="Subscribe to ak.wwise.core.profiler.gameObjectUnregistered. Returns subscription_id."),
-    "subscribe_topic_profiler_state_changed": Command(func=subscribe_topic_profiler_state_changed, doc="Subscribe to ak.wwise.core.profiler.stateChanged. Returns subscription_id."),
-    "subscribe_topic_profiler_switch_changed": Command(func=subscribe_topic_profiler_switch_changed, doc="Subscribe to ak.wwise.core.profiler.switchChanged. Returns subscription_id."),
-    "subscribe_topic_project_loaded": Command(func=subscribe_topic_project_loaded, doc="Subscribe to ak.wwise.core.project.loaded. Returns subscription_id."),
-    "subscribe_topic_project_post_closed": Command(func=subscribe_topic_project_post_closed, doc="Subscribe to ak.wwise.core.project.postClosed. Returns subscription_id."),
-    "subscribe_topic_project_pre_closed": Command(func=subscribe_topic_project_pre_closed, doc="Subscribe to ak.wwise.core.project.preClosed. Returns subscription_id."),
-    "subscribe_topic_project_saved": Command(func=subscribe_topic_project_saved, doc="Subscribe to ak.wwise.core.project.saved. Returns subscription_id."),
-    "subscribe_topic_soundbank_generated": Command(func=subscribe_topic_soundbank_generated, doc="Subscribe to ak.wwise.core.soundbank.generated. Returns subscription_id."),
-    "subscribe_topic_soundbank_generation_done": Command(func=subscribe_topic_soundbank_generation_done, doc="Subscribe to ak.wwise.core.soundbank.generationDone. Returns subscription_id."),
-    "subscribe_topic_switch_container_assignment_added": Command(func=subscribe_topic_switch_container_assignment_added, doc="Subscribe to ak.wwise.core.switchContainer.assignmentAdded. Returns subscription_id."),
-    "subscribe_topic_switch_container_assignment_removed": Command(func=subscribe_topic_switch_container_assignment_removed, doc="Subscribe to ak.wwise.core.switchContainer.assignmentRemoved. Returns subscription_id."),
-    "subscribe_topic_transport_state_changed": Command(func=subscribe_topic_transport_state_changed, doc="Subscribe to ak.wwise.core.transport.stateChanged. Returns subscription_id."),
-    "subscribe_topic_debug_assert_failed": Command(func=subscribe_topic_debug_assert_failed, doc="Subscribe to ak.wwise.debug.assertFailed (Debug builds). Returns subscription_id."),
-    "subscribe_topic_ui_commands_executed": Command(func=subscribe_topic_ui_commands_executed, doc="Subscribe to ak.wwise.ui.commands.executed. Returns subscription_id."),
-    "subscribe_topic_ui_selection_changed": Command(func=subscribe_topic_ui_selection_changed, doc="Subscribe to ak.wwise.ui.selectionChanged. Returns subscription_id."),
 }
 
+# One subscribe_topic_<name> command per WAAPI topic, generated from the library's URI table
+for _topic_name in WwisePythonLibrary.WAAPI_TOPIC_URIS:
+    _topic_func = f"subscribe_topic_{_topic_name}"
+    COMMANDS[_topic_func] = Command(
+        func=_wrap(_topic_func),
+        doc=f"{getattr(WwisePythonLibrary, _topic_func).__doc__} Returns subscription_id.",
+    )
+del _topic_name, _topic_func
+
 def list_commands()-> list[str]: 
     
     """
@@ -1215,26 +1193,73 @@ def list_commands()-> list[str]:
 
     specs = []
     for name, cmd in COMMANDS.items():
-        sig  = f"{name}{inspect.signature(cmd.func)}"
+        sig  = f"{name}{cmd.sig}"
         hint = cmd.doc.strip() if cmd.doc else ""
         # put the hint on its own new line
         specs.append(f"{sig}\n    {hint}")
     return specs
 
 #  A. parse a "verb(arg,…)" legacy string
-def _parse_call(call_str: str) -> tuple[str, list, dict]:
+def _fast_literal(node: ast.AST) -> any:
+    """Evaluate the common JSON-like literal nodes inline; defer anything else to ast.literal_eval."""
+    node_type = type(node)
+    if node_type is ast.Constant:
+        return node.value
+    if node_type is ast.List:
+        return [_fast_literal(e) for e in node.elts]
+    if node_type is ast.Dict:
+        if None in node.keys:
+            return ast.literal_eval(node)
+        return {_fast_literal(k): _fast_literal(v) for k, v in zip(node.keys, node.values)}
+    if node_type is ast.Tuple:
+        return tuple(_fast_literal(e) for e in node.elts)
+    if node_type is ast.Set:
+        return {_fast_literal(e) for e in node.elts}
+    if (node_type is ast.UnaryOp and type(node.op) is ast.USub
+            and type(node.operand) is ast.Constant
+            and type(node.operand.value) in (int, float)):
+        return -node.operand.value
+    return ast.literal_eval(node)
+
+def _lookup_command(verb: str) -> Command:
+    cmd = COMMANDS.get(verb)
+    if cmd is None:
+        raise ValueError(f"Unknown command '{verb}'")
+    return cmd
+
+@functools.lru_cache(maxsize=1024)
+def _parse_call(call_str: str) -> tuple[str, Command, list, dict]:
+    """Parse a call-string into (verb, cmd, args, kwargs). Cached and shared: callers must copy args/kwargs before use."""
     tree = ast.parse(call_str, mode="eval")
     if not isinstance(tree.body, ast.Call):
         raise ValueError(f"Expected func(...), got: {call_str}")
 
     verb   = tree.body.func.id
-    args   = [ast.literal_eval(a) for a in tree.body.args]
-    kwargs = {kw.arg: ast.literal_eval(kw.value)
+    args   = [_fast_literal(a) for a in tree.body.args]
+    kwargs = {kw.arg: _fast_literal(kw.value)
               for kw in tree.body.keywords}
-    return verb, args, kwargs
+    return verb, _lookup_command(verb), args, kwargs
+
+#  A2. compile any plan step (call-string or dict) to one tuple shape
+def _compile_step(step: any) -> tuple[str, Command, list, dict, str | None]:
+    """Return (verb, cmd, args, kwargs, save_as); unknown verbs raise here, before anything runs."""
+    if isinstance(step, str):
+        return (*_parse_call(step), None)
+    verb   = step["command"]
+    kwargs = step["args"]
+    return verb, _lookup_command(verb), [], kwargs, step.get("save_as")
 
 #  B. helper to extract .ids / .name from list-of-dicts 
 def _extract_attr(obj, attr):
+    obj_type = type(obj)
+    if obj_type is list:
+        try:
+            # WAAPI returns homogeneous lists of dicts; skip the per-element type check
+            return [d[attr] for d in obj if attr in d]
+        except TypeError:
+            return [d[attr] for d in obj if isinstance(d, dict) and attr in d]
+    if obj_type is dict:
+        return obj.get(attr)
     if isinstance(obj, list):
         return [d[attr] for d in obj if isinstance(d, dict) and attr in d]
     if isinstance(obj, dict):
@@ -1242,20 +1267,47 @@ def _extract_attr(obj, attr):
     return getattr(obj, attr)
 
 #  C. $var resolver (works on scalars / list / dict) 
+def _resolve_str(val: str, store: dict[str, any]) -> any:
+    if not val or val[0] != "$":
+        return val
+    key, *rest = val[1:].split(".", 1)
+    if key not in store:
+        raise KeyError(f"Variable '{key}' not found")
+    obj = store[key]
+    if rest:
+        obj = _extract_attr(obj, rest[0])
+    return obj
+
+def _resolve_container(val: list | dict, store: dict[str, any]) -> list | dict:
+    """Copy a nested list/dict literal, resolving $var strings, using an explicit stack."""
+    root  = [] if type(val) is list else {}
+    stack = [(val, root)]
+    while stack:
+        src, dst = stack.pop()
+        items = enumerate(src) if type(src) is list else src.items()
+        for k, v in items:
+            v_type = type(v)
+            if v_type is str:
+                v = _resolve_str(v, store)
+            elif v_type is list or v_type is dict:
+                child = [] if v_type is list else {}
+                stack.append((v, child))
+                v = child
+            if type(dst) is list:
+                dst.append(v)
+            else:
+                dst[k] = v
+    return root
+
+_RESOLVE_DISPATCH = {
+    str : _resolve_str,
+    list: _resolve_container,
+    dict: _resolve_container,
+}
+
 def _resolve(val, store):
-    if isinstance(val, str) and val.startswith("$"):
-        key, *rest = val[1:].split(".", 1)
-        if key not in store:
-            raise KeyError(f"Variable '{key}' not found")
-        obj = store[key]
-        if rest:
-            obj = _extract_attr(obj, rest[0])
-        return obj
-    if isinstance(val, list):
-        return [_resolve(v, store) for v in val]
-    if isinstance(val, dict):
-        return {k: _resolve(v, store) for k, v in val.items()}
-    return val
+    handler = _RESOLVE_DISPATCH.get(type(val))
+    return handler(val, store) if handler else val
 
 #  D. Commands that modify Wwise project (trigger undo wrap). Read-only / source_control get_* do NOT trigger.
 PLAN_MODIFYING_COMMANDS = frozenset({
@@ -1286,95 +1338,132 @@ PLAN_MODIFYING_COMMANDS = frozenset({
     "debug_restart_waapi_servers", "debug_test_assert", "debug_test_crash",
 })
 
-def _plan_verbs(plan: list[any]) -> list[str]:
-    """Collect verb (command name) from each step without executing. Used to decide if undo wrap is needed."""
-    verbs: list[str] = []
-    for step in plan:
-        if isinstance(step, str):
-            verb, _, _ = _parse_call(step)
-            verbs.append(verb)
-        else:
-            verbs.append(step["command"])
-    return verbs
+# Each command gets a bit position; a plan's verbs fold into one int mask.
+_VERB_INDEX: dict[str, int] = {name: i for i, name in enumerate(COMMANDS)}
+_MODIFYING_MASK: int = sum(1 << _VERB_INDEX[n] for n in PLAN_MODIFYING_COMMANDS if n in _VERB_INDEX)
+
+#  E. Commands after which a memoized project info must be refetched
+PROJECT_INFO_INVALIDATING_COMMANDS = frozenset({
+    "project_save",
+    "console_project_close", "console_project_create", "console_project_open",
+    "ui_project_close", "ui_project_create", "ui_project_open",
+})
+
+def _plan_verb_mask(steps: list[tuple]) -> int:
+    """Fold the verb (command name) of each compiled step into a bitmask. Used to decide if undo wrap is needed."""
+    mask = 0
+    for step in steps:
+        mask |= 1 << _VERB_INDEX[step[0]]
+    return mask
+
+def _compile_plan(plan: tuple[any, ...]) -> tuple[tuple[tuple, ...], bool]:
+    """Compile every step and decide undo wrapping once. Returns (steps, need_undo)."""
+    steps = tuple(_compile_step(step) for step in plan)
+    return steps, bool(_plan_verb_mask(steps) & _MODIFYING_MASK)
+
+# Plans made only of call-strings are hashable; identical resubmitted plans skip compilation.
+_compile_plan_cached = functools.lru_cache(maxsize=128)(_compile_plan)
+
+def _cancel_undo_group(cause: Exception, log: list[dict[str, any]], reason: str) -> None:
+    """Cancel the plan's undo group and wait for Wwise to confirm it.
+
+    A failed cancel leaves the earlier steps applied, so it is logged and noted on
+    `cause`, the exception the plan is about to raise.
+    """
+    try:
+        cancel_result = WwisePythonLibrary.undo_cancel_group()
+        log.append({"command": "undo_cancel_group", "kwargs": {}, "result": cancel_result, "reason": reason})
+    except Exception as cancel_e:
+        logger.error("undo_cancel_group failed %s; plan changes were not reverted", reason, exc_info=True)
+        log.append({"command": "undo_cancel_group", "kwargs": {}, "result": None, "reason": reason, "error": str(cancel_e)})
+        cause.add_note(f"undo_cancel_group also failed ({cancel_e}); changes made by the plan were not reverted")
 
 def _run_plan_sync(plan: list[any]) -> list[dict[str, any]]:
     store: dict[str, any] = {}        # per-plan variable bucket
-    log  : list[dict[str, any]] = []
-
-    def _run_one(verb: str, args: list, kwargs: dict, save_as: str | None) -> any:
-        if verb not in COMMANDS:
-            raise ValueError(f"Unknown command '{verb}'")
-        func = COMMANDS[verb].func
-        inspect.signature(func).bind_partial(*args, **kwargs)
-        result = func(*args, **kwargs)
+    log  : list[dict[str, any]] = []  # connect / undo bookkeeping entries
+
+    # Plan step log kept as parallel arrays; merged into `log` once the plan succeeds
+    step_count    = len(plan)
+    step_commands : list[str | None] = [None] * step_count
+    step_kwargs   : list[dict | None] = [None] * step_count
+    step_results  : list[any] = [None] * step_count
+
+    def _run_one(verb: str, cmd: Command, args: list, kwargs: dict, save_as: str | None) -> any:
+        cmd.sig.bind_partial(*args, **kwargs)
+        result = cmd.func(*args, **kwargs)
+        if verb in PROJECT_INFO_INVALIDATING_COMMANDS:
+            WwisePythonLibrary.invalidate_project_info_cache()
+        if verb in PLAN_MODIFYING_COMMANDS:
+            WwisePythonLibrary.invalidate_object_caches()
         store["last"] = result
         if save_as:
             store[save_as] = result
         return result
 
-    # 0) Ensure WAAPI connected before any Wwise command
+    # Compile every step up front: unknown commands fail before touching Wwise
+    plan_key = tuple(plan)
+    if all(isinstance(step, str) for step in plan_key):
+        steps, need_undo = _compile_plan_cached(plan_key)
+    else:
+        steps, need_undo = _compile_plan(plan_key)
+
+    # 0) Ensure WAAPI connected before any Wwise command.
+    #    Reuses the persistent client; only (re)connects if it is missing or dead.
     try:
-        conn_result = _run_one("connect_to_wwise", [], {}, None)
-        log.append({"command": "connect_to_wwise", "kwargs": {}, "result": conn_result})
+        reused = ensure_wwise_connection()
+        log.append({"command": "ensure_wwise_connection", "kwargs": {}, "result": {"reused": reused}})
     except Exception as e:
-        logger.exception("connect_to_wwise failed at start of plan")
-        log.append({"command": "connect_to_wwise", "kwargs": {}, "result": None, "error": str(e)})
+        logger.exception("ensure_wwise_connection failed at start of plan")
+        log.append({"command": "ensure_wwise_connection", "kwargs": {}, "result": None, "error": str(e)})
         raise
 
     # 1) Only wrap with undo when plan contains at least one project-modifying command
-    plan_verbs = _plan_verbs(plan)
-    need_undo = any(v in PLAN_MODIFYING_COMMANDS for v in plan_verbs)
-
     if need_undo:
-        # 1a) Start undo group so the whole plan is one undo step in Wwise
+        # 1a) Start undo group so the whole plan is one undo step in Wwise.
+        #     Awaited: if Wwise refuses the group, no step may run outside it.
         try:
-            beg_result = _run_one("undo_begin_group", [], {}, None)
-            log.append({"command": "undo_begin_group", "kwargs": {}, "result": beg_result})
+            begin_result = WwisePythonLibrary.undo_begin_group()
+            log.append({"command": "undo_begin_group", "kwargs": {}, "result": begin_result})
         except Exception as e:
             logger.exception("undo_begin_group failed before running plan")
             log.append({"command": "undo_begin_group", "kwargs": {}, "result": None, "error": str(e)})
             raise
 
-    # 2) Run user plan steps
+    # 2) Run user plan steps (project info is fetched at most once per plan)
     try:
-        for step in plan:
-            if isinstance(step, str):
-                verb, args, kwargs = _parse_call(step)
+        with WwisePythonLibrary.project_info_cache_scope():
+            for i, (verb, cmd, args, kwargs, save_as) in enumerate(steps):
+                # Always a fresh copy: compiled steps are cached and shared by every
+                # run of the plan, so neither the command nor the caller (via the
+                # returned log) may hold the cached containers. $vars are resolved
+                # in the same pass.
                 args   = _resolve(args, store)
                 kwargs = _resolve(kwargs, store)
-                save_as = None
-            else:
-                verb   = step["command"]
-                args   = []
-                kwargs = _resolve(step["args"], store)
-                save_as = step.get("save_as")
 
-            result = _run_one(verb, args, kwargs, save_as)
-            log.append({"command": verb, "kwargs": kwargs, "result": result})
+                step_commands[i] = verb
+                step_kwargs[i]   = kwargs
+                step_results[i]  = _run_one(verb, cmd, args, kwargs, save_as)
     except Exception as e:
         if need_undo:
             # 3a) Plan failed: cancel undo group so Wwise reverts all changes (all-or-nothing)
             logger.exception("Plan step failed, cancelling undo group")
-            try:
-                cancel_result = _run_one("undo_cancel_group", [], {}, None)
-                log.append({"command": "undo_cancel_group", "kwargs": {}, "result": cancel_result})
-            except Exception as cancel_e:
-                logger.warning("undo_cancel_group failed: %s", cancel_e)
-                log.append({"command": "undo_cancel_group", "kwargs": {}, "result": None, "error": str(cancel_e)})
+            _cancel_undo_group(e, log, reason="after plan step failure")
         raise
 
+    log.extend(
+        {"command": c, "kwargs": k, "result": r}
+        for c, k, r in zip(step_commands, step_kwargs, step_results)
+    )
+
     if need_undo:
-        # 3b) All steps ok: end undo group so the whole plan is one undo step
+        # 3b) All steps ok: end undo group so the whole plan is one undo step.
+        #     Awaited so that a failed end is seen here, and the group can still be cancelled and the error reported.
         try:
-            end_result = _run_one("undo_end_group", [], {}, None)
+            end_result = _run_one("undo_end_group", COMMANDS["undo_end_group"], [], {}, None)
             log.append({"command": "undo_end_group", "kwargs": {}, "result": end_result})
         except Exception as e:
             logger.exception("undo_end_group failed after plan succeeded")
-            try:
-                _run_one("undo_cancel_group", [], {}, None)
-                log.append({"command": "undo_cancel_group", "kwargs": {}, "result": None, "reason": "after undo_end_group failure"})
-            except Exception:
-                pass
+            _cancel_undo_group(e, log, reason="after undo_end_group failure")
             log.append({"command": "undo_end_group", "kwargs": {}, "result": None, "error": str(e)})
             raise
 
@@ -1395,6 +1484,11 @@ async def execute_plan( plan: list[str]) -> dict [str, any]:
     """
     Execute a JSON list of call-strings produced by Claude.
     Returns simple success/failure info.
+
+    The plan runs on a worker thread so the event loop stays free for other
+    tools. Steps are executed in order: every WAAPI call goes through the
+    single session dispatcher (one socket, one in-flight call), and steps
+    inside an undo group must keep their order for cancel to be correct.
     """
     
     log = await anyio.to_thread.run_sync(_run_plan_sync, plan)
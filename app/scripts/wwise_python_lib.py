@@ -1,9 +1,17 @@
 from pathlib import Path
 from typing import Iterable, Mapping, Any
 import math 
-import secrets
+import os
+import asyncio
+import random
 import time
 import logging
+import threading
+import contextlib
+import functools
+import hashlib
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
 import wwise_session as WwiseSession
 
 from wwise_errors import (
@@ -23,6 +31,9 @@ logger = logging.getLogger(__name__)
 def connect_to_waapi(): 
     WwiseSession.connect_to_waapi()
 
+def ensure_connected() -> bool: 
+    return WwiseSession.ensure_connected()
+
 def disconnect_from_wwise_client(): 
     WwiseSession.disconnect_from_wwise_client()
 
@@ -37,40 +48,168 @@ def waapi_call(
     
     return WwiseSession.waapi_call(uri, args or {}, options=options, **kw)
 
+def waapi_call_batch(
+    calls: Iterable[tuple[str, Mapping[str, Any], float | None]],
+    options: Mapping[str, Any] | None = None
+)-> None:
+    """Fire-and-forget many (uri, args, due_in) calls, enqueued on the dispatcher in one shot."""
+    calls = list(calls)
+    if not calls:
+        return
+    WwiseSession.waapi_call_batch(calls, options=options)
+
+def waapi_call_many(
+    calls: Iterable[tuple[str, Mapping[str, Any], Mapping[str, Any] | None]],
+    *,
+    return_exceptions: bool = False,
+    **kw: Any
+)-> list:
+    """Pipeline many (uri, args, options) calls that need replies; results come back in order."""
+    return WwiseSession.waapi_call_many(list(calls), return_exceptions=return_exceptions, **kw)
+
+# Group waapi_call()s on this thread into one dispatcher enqueue; see WwiseSession.WaapiBatch.
+WaapiBatch = WwiseSession.WaapiBatch
+WaapiBatchResult = WwiseSession.WaapiBatchResult
+waapi_batch = WaapiBatch
+
+def call_batched(func, calls: Iterable[tuple[tuple, Mapping[str, Any]]]) -> list:
+    """
+    Run func(*args, **kwargs) for every (args, kwargs) in calls inside one WaapiBatch
+    and return their replies in order, e.g.
+
+        call_batched(soundengine_post_trigger, [(("Hit", "Player"), {}), (("Hit", "Enemy"), {})])
+
+    func must be a wrapper that returns its single waapi_call() reply unchanged
+    (the soundengine_* / object_* wrappers below); internal lookups it makes
+    (game objects, paths) still run immediately. The first failure is raised.
+    """
+    with WaapiBatch():
+        pending = [func(*args, **kwargs) for args, kwargs in calls]
+    return [p.result() if isinstance(p, WaapiBatchResult) else p for p in pending]
+
+# waapi_call for internal calls whose reply is consumed on the spot (cache fills, lookups,
+# creates whose new id is needed next): bound straight to the session, and these bypass
+# an open WaapiBatch instead of getting a placeholder back.
+_waapi_read = functools.partial(WwiseSession.waapi_call, _batchable=False)
+# Raised when Wwise itself rejects a call (bad arguments, unknown property, name
+# conflict, ...); connection loss and timeouts surface as other exception types.
+WaapiRequestFailed = WwiseSession.WaapiRequestFailed
+
+# object.set applies every listed change before it replies, so a large batch can outlast
+# the session's 1 s default; a timeout there does not mean nothing was applied.
+_SET_TIMEOUT_BASE_S = 1.0
+_SET_TIMEOUT_PER_ITEM_S = 0.05
+
+def _set_timeout(count: int) -> float:
+    """Reply timeout for an ak.wwise.core.object.set call touching `count` objects."""
+    return _SET_TIMEOUT_BASE_S + count * _SET_TIMEOUT_PER_ITEM_S
+
+# WAAPI_STRICT=1 re-enables response shape checks that the getters otherwise skip
+# (WAAPI responses follow the documented schema; these only help when debugging).
+_WAAPI_STRICT = os.environ.get("WAAPI_STRICT", "0").strip().lower() in ("1", "true", "yes")
+
+def _call(
+    operation: str,
+    args: dict,
+    options: dict | None = None,
+    *,
+    what: str,
+    **details: Any
+) -> Any:
+    """
+    _waapi_read with the getters' shared error translation: library errors
+    pass through; anything else becomes WwiseApiError("Unexpected error <what>: ...")
+    with error_type plus `details`.
+    """
+    try:
+        return _waapi_read(operation, args, options)
+    except WwisePyLibError:
+        raise
+    except Exception as e:
+        raise WwiseApiError(
+            f"Unexpected error {what}: {str(e)}",
+            operation=operation,
+            details={"error_type": type(e).__name__, **details}
+        ) from e
+
 # ==============================================================================
 #                               Soundbank 
 # ==============================================================================
 
+# Constant args for read-only getters, built once at import. Never mutate these:
+# they are shared by every call (plain dicts, since WAAPI must serialize them).
+_PROJECT_INFO_ARGS: dict = {}
+_SOUNDBANKS_GET_ARGS: dict = {
+    "from": {"path": ["\\SoundBanks"]},
+    "transform": [{"select": ["descendants"]}],
+    "options": {"return": ["name", "type", "path"]}
+}
+# Server-side filtered form: only SoundBank objects cross the socket.
+_SOUNDBANKS_WAQL_ARGS: dict = {"waql": '"\\SoundBanks" select descendants where type = "SoundBank"'}
+_SOUNDBANKS_WAQL_OPTIONS: dict = {"return": ["name"]}
+_SOUNDBANKS_CACHE_KEY = ("\\SoundBanks", ("SoundBank",), "")
+
+# Per-thread memo for get_project_info(); only active inside project_info_cache_scope().
+_project_info_scope = threading.local()
+# Process-wide short-lived memo: languages/platforms only change through project edits.
+_PROJECT_INFO_TTL_S = 5.0
+_project_info_cache: dict[str, Any] = {"at": None, "value": None}
+
+@contextlib.contextmanager
+def project_info_cache_scope():
+    """Reuse one getProjectInfo response for every get_project_info() call made by this thread inside the block."""
+    _project_info_scope.active = True
+    _project_info_scope.value = None
+    try:
+        yield
+    finally:
+        _project_info_scope.active = False
+        _project_info_scope.value = None
+
+def invalidate_project_info_cache() -> None:
+    """Drop the memoized project info so the next get_project_info() refetches it."""
+    _project_info_scope.value = None
+    _project_info_cache["at"] = None
+    _project_info_cache["value"] = None
+
 def get_project_info() -> dict:
     """
     Retrieve information about the currently open Wwise project.
     
+    Inside project_info_cache_scope() the response is fetched once and reused
+    until the scope exits or invalidate_project_info_cache() is called.
+    Outside it, a response younger than _PROJECT_INFO_TTL_S is reused.
+    
     Returns:
         dict: Project information including name, path, platform details, etc.
         
     Raises:
         WwiseApiError: If the WAAPI call fails or no project is open.
     """
-    try:
-        response = waapi_call("ak.wwise.core.getProjectInfo", {})
-        
-        if response is None:
-            raise WwiseApiError(
-                "WAAPI returned None when fetching project info (no project may be open)",
-                operation="ak.wwise.core.getProjectInfo"
-            )
-        
-        return response
+    cache_active = getattr(_project_info_scope, "active", False)
+    if cache_active and _project_info_scope.value is not None:
+        return _project_info_scope.value
     
-    except WwisePyLibError:
-        raise
+    at, cached = _project_info_cache["at"], _project_info_cache["value"]
+    if at is not None and time.monotonic() - at < _PROJECT_INFO_TTL_S:
+        if cache_active:
+            _project_info_scope.value = cached
+        return cached
     
-    except Exception as e:
+    response = _call("ak.wwise.core.getProjectInfo", _PROJECT_INFO_ARGS, what="fetching project info")
+    
+    if response is None:
         raise WwiseApiError(
-            f"Unexpected error fetching project info: {str(e)}",
-            operation="ak.wwise.core.getProjectInfo",
-            details={"error_type": type(e).__name__}
+            "WAAPI returned None when fetching project info (no project may be open)",
+            operation="ak.wwise.core.getProjectInfo"
         )
+    
+    if cache_active:
+        _project_info_scope.value = response
+    _project_info_cache["at"] = time.monotonic()
+    _project_info_cache["value"] = response
+    
+    return response
 
 def get_all_languages() -> list[str]:
     """
@@ -153,6 +292,21 @@ def get_all_platforms() -> list[str]:
             details={"error_type": type(e).__name__}
         )
 
+def _soundbank_query_rows(response: dict | None) -> list[dict]:
+    """The 'return' rows of a SoundBank object.get reply; errors on a missing or malformed reply."""
+    if response is None:
+        raise WwiseApiError(
+            "WAAPI returned None when fetching SoundBanks",
+            operation="ak.wwise.core.object.get",
+            details={"path": "\\SoundBanks"}
+        )
+    
+    if "return" not in response:
+        raise WwiseValidationError(
+            "Response missing 'return' field when fetching SoundBanks"
+        )
+    return response["return"]
+
 def get_all_soundbanks() -> list[str]:
     """
     Retrieve all SoundBanks configured in the current Wwise project.
@@ -164,33 +318,26 @@ def get_all_soundbanks() -> list[str]:
         WwiseApiError: If the WAAPI call fails.
         WwiseValidationError: If the response is malformed.
     """
-    args = {
-        "from": {"path": ["\\SoundBanks"]},
-        "transform": [{"select": ["descendants"]}],
-        "options": {"return": ["name", "type", "path"]}
-    }
-    
+    # Shares the name-list memo, so object create/rename/delete events invalidate it
+    cached = _name_list_cache_get(_SOUNDBANKS_CACHE_KEY)
+    if cached is not None:
+        return cached
+
     try:
-        response = waapi_call("ak.wwise.core.object.get", args)
-        
-        if response is None:
-            raise WwiseApiError(
-                "WAAPI returned None when fetching SoundBanks",
-                operation="ak.wwise.core.object.get",
-                details={"path": "\\SoundBanks"}
-            )
-        
-        if "return" not in response:
-            raise WwiseValidationError(
-                "Response missing 'return' field when fetching SoundBanks"
-            )
-        
-        # Filter objects of type 'SoundBank'
-        soundbanks = [
-            obj["name"] for obj in response["return"] 
-            if obj.get("type") == "SoundBank"
-        ]
-        
+        try:
+            response = _waapi_read("ak.wwise.core.object.get", _SOUNDBANKS_WAQL_ARGS, _SOUNDBANKS_WAQL_OPTIONS)
+            soundbanks = [obj["name"] for obj in _soundbank_query_rows(response)]
+        except WaapiRequestFailed:
+            # Older Authoring without WAQL rejects the query: fetch every descendant and filter here.
+            # Connection errors and timeouts are not retried; the fallback would fail the same way.
+            logger.debug("WAQL SoundBank query rejected; filtering descendants locally", exc_info=True)
+            response = _waapi_read("ak.wwise.core.object.get", _SOUNDBANKS_GET_ARGS)
+            soundbanks = [
+                obj["name"] for obj in _soundbank_query_rows(response)
+                if obj.get("type") == "SoundBank"
+            ]
+
+        _name_list_cache_put(_SOUNDBANKS_CACHE_KEY, soundbanks)
         return soundbanks
     
     except WwisePyLibError:
@@ -211,6 +358,25 @@ def get_all_soundbanks() -> list[str]:
             }
         )
 
+# Awaitable variants for asyncio callers. Each runs its sync twin in a worker
+# thread; the WAAPI calls themselves still go through the single dispatcher.
+async def aget_project_info() -> dict:
+    return await asyncio.to_thread(get_project_info)
+
+async def aget_all_languages() -> list[str]:
+    return await asyncio.to_thread(get_all_languages)
+
+async def aget_all_platforms() -> list[str]:
+    return await asyncio.to_thread(get_all_platforms)
+
+async def aget_all_soundbanks() -> list[str]:
+    return await asyncio.to_thread(get_all_soundbanks)
+
+# Max inclusions sent per setInclusions call; larger requests are chunked.
+_INCLUSION_BATCH_SIZE = 100
+# Inclusion filter shared by every inclusion entry (read-only).
+_INCLUSION_FILTER = ["events", "structures"]
+
 def include_in_soundbank(
     include_paths: list[str], 
     soundbank_path: str
@@ -218,16 +384,17 @@ def include_in_soundbank(
     """
     Add objects to a SoundBank's inclusions list.
     
-    Note: This operation is NOT atomic. If a failure occurs, all previous
-    inclusions will have succeeded. The returned list contains responses for
-    successfully included objects before the failure.
+    All inclusions are sent in a single setInclusions call (chunked by
+    _INCLUSION_BATCH_SIZE for very large lists), so each chunk is applied
+    atomically by Wwise. Chunks are pipelined: if one fails, the others
+    have still been applied.
     
     Args:
         include_paths: List of Wwise object paths to include in the SoundBank.
         soundbank_path: Path to the target SoundBank.
     
     Returns:
-        list[dict]: List of WAAPI responses for each successful inclusion operation.
+        list[dict]: List of WAAPI responses, one per setInclusions call.
         
     Raises:
         WwiseValidationError: If inputs are invalid.
@@ -239,7 +406,7 @@ def include_in_soundbank(
     if not soundbank_path or not soundbank_path.strip():
         raise WwiseValidationError("soundbank_path cannot be empty")
     
-    result: list[dict] = []
+    inclusions: list[dict] = []
     
     for i, include_path in enumerate(include_paths):
         if not include_path or not include_path.strip():
@@ -247,45 +414,53 @@ def include_in_soundbank(
                 f"include_path at index {i} cannot be empty"
             )
         
-        args = {
-            "soundbank": soundbank_path,
-            "operation": "add",
-            "inclusions": [{
-                "object": include_path,
-                "filter": ["events", "structures"]
-            }]
-        }
-        
-        try:
-            response = waapi_call("ak.wwise.core.soundbank.setInclusions", args)
-            
-            if response is None:
-                raise WwiseApiError(
-                    f"WAAPI returned None when including object at index {i}",
-                    operation="ak.wwise.core.soundbank.setInclusions",
-                    details={
-                        "soundbank_path": soundbank_path,
-                        "include_path": include_path,
-                        "index": i
-                    }
-                )
-            
-            result.append(response)
+        inclusions.append({
+            "object": include_path,
+            "filter": _INCLUSION_FILTER
+        })
+    
+    starts = range(0, len(inclusions), _INCLUSION_BATCH_SIZE)
+    # All chunks are pipelined through the dispatcher; replies are checked in order
+    responses = waapi_call_many(
+        [
+            ("ak.wwise.core.soundbank.setInclusions",
+             {"soundbank": soundbank_path, "operation": "add",
+              "inclusions": inclusions[start:start + _INCLUSION_BATCH_SIZE]},
+             None)
+            for start in starts
+        ],
+        return_exceptions=True
+    )
+    
+    result: list[dict] = []
+    
+    for start, response in zip(starts, responses):
+        end = min(start + _INCLUSION_BATCH_SIZE, len(inclusions))
         
-        except WwisePyLibError:
-            raise
+        if isinstance(response, BaseException):
+            raise WwiseApiError(
+                f"Failed to include objects at index {start}-{end - 1}: {str(response)}",
+                operation="ak.wwise.core.soundbank.setInclusions",
+                details={
+                    "error_type": type(response).__name__,
+                    "soundbank_path": soundbank_path,
+                    "include_paths": include_paths[start:end],
+                    "index": start
+                }
+            ) from response
         
-        except Exception as e:
+        if response is None:
             raise WwiseApiError(
-                f"Failed to include object at index {i}: {str(e)}",
+                f"WAAPI returned None when including objects at index {start}-{end - 1}",
                 operation="ak.wwise.core.soundbank.setInclusions",
                 details={
-                    "error_type": type(e).__name__,
                     "soundbank_path": soundbank_path,
-                    "include_path": include_path,
-                    "index": i
+                    "include_paths": include_paths[start:end],
+                    "index": start
                 }
             )
+        
+        result.append(response)
     
     return result
 
@@ -315,21 +490,14 @@ def generate_soundbanks(
     if not platforms:
         raise WwiseValidationError("platforms list cannot be empty")
     
-    # Validate individual items
-    for i, sb in enumerate(soundbanks):
-        if not sb or not sb.strip():
-            raise WwiseValidationError(f"SoundBank name at index {i} cannot be empty")
+    if languages is not None and not languages:
+        raise WwiseValidationError("languages list cannot be empty (use None for all languages)")
     
-    for i, platform in enumerate(platforms):
-        if not platform or not platform.strip():
-            raise WwiseValidationError(f"Platform name at index {i} cannot be empty")
-    
-    if languages is not None:
-        if not languages:
-            raise WwiseValidationError("languages list cannot be empty (use None for all languages)")
-        for i, lang in enumerate(languages):
-            if not lang or not lang.strip():
-                raise WwiseValidationError(f"Language name at index {i} cannot be empty")
+    # Validate individual items in one pass (isspace avoids a strip() copy per name)
+    for kind, names in (("SoundBank", soundbanks), ("Platform", platforms), ("Language", languages or ())):
+        for i, name in enumerate(names):
+            if not name or name.isspace():
+                raise WwiseValidationError(f"{kind} name at index {i} cannot be empty")
     
     # Build the payload
     payload = {
@@ -379,8 +547,112 @@ def generate_soundbanks(
 LISTENER_ID = 1
 DEFAULT_GAME_OBJ_NAME = "Global"
 
-def get_all_game_objs_in_wwise_session() -> list[dict]:
-    return waapi_call("ak.wwise.core.profiler.getGameObjects", {"time": "capture"})
+# Cache of the profiler game object list, indexed by id and by lowercased name.
+# Registrations made through this module are applied to it directly. When the
+# profiler gameObject* topics can be subscribed, their events keep it current and
+# getGameObjects only runs for a reset or the slow safety resync; otherwise the
+# short TTL applies.
+_GAME_OBJ_CACHE_TTL_S = 0.25
+_GAME_OBJ_LIVE_TTL_S = 5.0
+_go_cache: dict[str, Any] = {"at": None, "response": None, "by_name": {}, "by_id": set()}
+_GET_GAME_OBJECTS_ARGS: dict = {"time": "capture"}   # shared, never mutated
+
+_GO_REGISTERED_TOPIC = "ak.wwise.core.profiler.gameObjectRegistered"
+_GO_UNREGISTERED_TOPIC = "ak.wwise.core.profiler.gameObjectUnregistered"
+_GO_RESET_TOPIC = "ak.wwise.core.profiler.gameObjectReset"
+_go_subs: dict[str, Any] = {"generation": None, "ids": None}
+# MCP tools run on worker threads: guards _go_cache and makes lookup-or-allocate
+# atomic, so two concurrent ensure_game_obj("X") calls register one object.
+_go_cache_lock = threading.RLock()
+# Ids only need to be unique within the session (checked against the cache), not
+# unpredictable; a seeded Mersenne Twister avoids a urandom syscall per draw.
+_gid_rng = random.Random(os.urandom(16))
+
+def _game_obj_cache_add(gid: int, name: str) -> None:
+    with _go_cache_lock:
+        response = _go_cache["response"]
+        if response is not None:
+            _go_cache["response"] = {**response, "return": [*response.get("return", []), {"id": gid, "name": name}]}
+        _go_cache["by_id"].add(gid)
+        if name.strip():
+            _go_cache["by_name"].setdefault(name.strip().lower(), gid)
+
+def _game_obj_cache_remove(gid: int) -> None:
+    with _go_cache_lock:
+        response = _go_cache["response"]
+        if response is not None:
+            _go_cache["response"] = {**response, "return": [go for go in response.get("return", []) if int(go["id"]) != gid]}
+        _go_cache["by_id"].discard(gid)
+        _go_cache["by_name"] = {n: i for n, i in _go_cache["by_name"].items() if i != gid}
+
+def _subscribe_topics_once(subs: dict[str, Any], topics: Iterable[str]) -> bool:
+    """Subscribe to topics once per connection, recording ids in subs. Returns True when live."""
+    generation = WwiseSession.connection_generation()
+    if subs["generation"] == generation:
+        return subs["ids"] is not None
+
+    subs["generation"] = generation
+    subs["ids"] = None
+    try:
+        subs["ids"] = {uri: WwiseSession.waapi_subscribe(uri) for uri in topics}
+    except Exception:
+        logger.debug("Could not subscribe to %s; falling back to TTL caching", list(topics), exc_info=True)
+    return subs["ids"] is not None
+
+def _game_obj_subscribe() -> bool:
+    return _subscribe_topics_once(_go_subs, (_GO_REGISTERED_TOPIC, _GO_UNREGISTERED_TOPIC, _GO_RESET_TOPIC))
+
+def _game_obj_event_fields(event: dict) -> tuple[int | None, str | None]:
+    go = event.get("gameObject", event)
+    if not isinstance(go, dict) or "id" not in go:
+        return None, None
+    name = go.get("name")
+    return int(go["id"]), name if isinstance(name, str) else None
+
+def _game_obj_cache_apply_events() -> bool:
+    """Fold queued registration events into the cache. Returns False when a reset requires a refetch."""
+    ids = _go_subs["ids"]
+    if WwiseSession.waapi_subscription_events(ids[_GO_RESET_TOPIC]):
+        return False
+    for event in WwiseSession.waapi_subscription_events(ids[_GO_REGISTERED_TOPIC]):
+        gid, name = _game_obj_event_fields(event)
+        if gid is not None and gid not in _go_cache["by_id"]:
+            _game_obj_cache_add(gid, name or "")
+    for event in WwiseSession.waapi_subscription_events(ids[_GO_UNREGISTERED_TOPIC]):
+        gid, _ = _game_obj_event_fields(event)
+        if gid is not None:
+            _game_obj_cache_remove(gid)
+    return True
+
+def get_all_game_objs_in_wwise_session() -> dict:
+    with _go_cache_lock:
+        return _get_all_game_objs_locked()
+
+def _get_all_game_objs_locked() -> dict:
+    live = _game_obj_subscribe()
+    at = _go_cache["at"]
+    ttl = _GAME_OBJ_LIVE_TTL_S if live else _GAME_OBJ_CACHE_TTL_S
+    if at is not None and time.monotonic() - at < ttl:
+        if not live or _game_obj_cache_apply_events():
+            return _go_cache["response"]
+
+    if live:
+        # The snapshot below supersedes anything queued so far
+        for sub_id in _go_subs["ids"].values():
+            WwiseSession.waapi_subscription_events(sub_id)
+
+    response = _waapi_read("ak.wwise.core.profiler.getGameObjects", _GET_GAME_OBJECTS_ARGS)
+    _go_cache["at"] = time.monotonic()
+    _go_cache["response"] = response
+    game_objs = response.get("return", [])
+    # reversed so that, as with a front-to-back scan, the first object with a given name wins
+    _go_cache["by_name"] = {
+        go["name"].strip().lower(): int(go["id"])
+        for go in reversed(game_objs)
+        if isinstance(go.get("name"), str) and go["name"].strip()
+    }
+    _go_cache["by_id"] = {int(go["id"]) for go in game_objs}
+    return response
 
 def register_default_listener()-> None:
     waapi_call("ak.soundengine.registerGameObj", 
@@ -388,18 +660,23 @@ def register_default_listener()-> None:
                  "name": "listener"}) 
     waapi_call("ak.soundengine.setDefaultListeners", 
                {"listeners" : [LISTENER_ID]})
+    _game_obj_cache_add(LISTENER_ID, "listener")
         
 def alloc_game_object_id(name : str) -> int:
+    with _go_cache_lock:
+        return _alloc_game_object_id_locked(name)
+
+def _alloc_game_object_id_locked(name : str) -> int:
     
-    game_objs = get_all_game_objs_in_wwise_session().get("return",[])
-    existing = {int(go["id"]) for go in game_objs}
+    get_all_game_objs_in_wwise_session()
+    existing = _go_cache["by_id"]
     max_tries = 64
 
     if LISTENER_ID not in existing:
         register_default_listener()
 
     for _ in range(max_tries):
-        gid = secrets.randbits(31)           
+        gid = _gid_rng.getrandbits(31)
         
         if gid not in existing:
             waapi_call(
@@ -412,7 +689,8 @@ def alloc_game_object_id(name : str) -> int:
                     "emitter":   gid,          # game object that produces sound
                     "listeners": [LISTENER_ID]        # one or many listener IDs
                 }) 
-            time.sleep(0.02) # short delay so the next read from capture gets the updated game obj list 
+            # Recorded locally; no need to wait for the capture to list it
+            _game_obj_cache_add(gid, name)
             return gid
     raise RuntimeError("Could not allocate a unique game object ID")
 
@@ -421,19 +699,11 @@ def ensure_game_obj(name: str) -> int:
     if not isinstance(name, str) or not name.strip():
         raise ValueError("Provide a non empty string name when creating a game obj.")
 
-    game_objs = get_all_game_objs_in_wwise_session().get("return",[])    
-    cleansed_name = name.strip().lower()
-
-    for game_obj in game_objs : 
-        game_obj_name = game_obj["name"]
-        
-        if not isinstance(game_obj_name, str) or not game_obj_name.strip(): 
-            continue
-
-        if (game_obj_name.lower() == cleansed_name):
-            return game_obj["id"]
+    with _go_cache_lock:
+        get_all_game_objs_in_wwise_session()   # refreshes the name index when stale
+        gid = _go_cache["by_name"].get(name.strip().lower())
 
-    return alloc_game_object_id(name)
+        return gid if gid is not None else _alloc_game_object_id_locked(name)
 
 def set_game_obj_position(
     game_obj_name : str, 
@@ -460,7 +730,7 @@ Vec3 = tuple[float, float, float]
 
 def _norm_vec(v: Vec3) -> Vec3:
     x,y,z = v
-    n = math.sqrt(x*x + y*y + z*z) or 1.0
+    n = math.hypot(x, y, z) or 1.0
     return (x/n, y/n, z/n)
 
 def _dot(a: Vec3, b: Vec3) -> float:
@@ -469,28 +739,24 @@ def _dot(a: Vec3, b: Vec3) -> float:
 def _sub(a: Vec3, b: Vec3) -> Vec3:
     return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
 
-def _lerp(a: Vec3, b: Vec3, t: float) -> Vec3:
-    return (a[0] + (b[0]-a[0])*t,
-            a[1] + (b[1]-a[1])*t,
-            a[2] + (b[2]-a[2])*t)
-
 def _orthonormalize(front: Vec3, top: Vec3) -> tuple[Vec3, Vec3]:
     f = _norm_vec(front)
     # Gram–Schmidt: make top orthogonal to front, then normalize
-    t = _sub(top, (f[0]*_dot(top,f), f[1]*_dot(top,f), f[2]*_dot(top,f)))
-    if t == (0.0,0.0,0.0):
+    d = _dot(top, f)
+    t = (top[0] - f[0]*d, top[1] - f[1]*d, top[2] - f[2]*d)
+    if t[0]*t[0] + t[1]*t[1] + t[2]*t[2] < 1e-20:   # top (anti)parallel to front
         t = (0.0,1.0,0.0)
     return f, _norm_vec(t)
 
-def _enqueue_position(gid: int, pos: Vec3, front: Vec3, top: Vec3, *, due_in_s: float):
-    waapi_call("ak.soundengine.setPosition", {
+def _position_args(gid: int, pos: Vec3, front_dict: dict, top_dict: dict) -> dict:
+    return {
         "gameObject": gid,
         "position": {
             "position": {"x": pos[0], "y": pos[1], "z": pos[2]},
-            "orientationFront": {"x": front[0], "y": front[1], "z": front[2]},
-            "orientationTop":   {"x": top[0],   "y": top[1],   "z": top[2]},
+            "orientationFront": front_dict,
+            "orientationTop":   top_dict,
         }
-    }, due_in = due_in_s, wait = False)
+    }
 
 def start_position_ramp(
     *,
@@ -505,17 +771,21 @@ def start_position_ramp(
 )-> None:
     """
     Schedules an interpolation of (x,y,z) from start_pos to end_pos over duration_ms.
-    Uses the dispatcher-backed waapi_call(due_in=..., wait=False) for each step.
-    Returns a tiny handle with no-op stop/join (for API parity).
+    All steps are enqueued on the dispatcher in one waapi_call_batch, each with its own due_in.
     """
 
     gid = ensure_game_obj(obj)
 
     f, t = _orthonormalize(front, top)
+    # Orientation is constant over the ramp: build its dicts once and share them across steps
+    front_dict = {"x": f[0], "y": f[1], "z": f[2]}
+    top_dict   = {"x": t[0], "y": t[1], "z": t[2]}
 
     if duration_ms <=0 :
-        _enqueue_position(gid, start_pos, f, t, due_in_s=0.0)
-        _enqueue_position(gid, end_pos,   f, t, due_in_s=0.0)
+        waapi_call_batch([
+            ("ak.soundengine.setPosition", _position_args(gid, start_pos, front_dict, top_dict), 0.0),
+            ("ak.soundengine.setPosition", _position_args(gid, end_pos,   front_dict, top_dict), 0.0),
+        ])
         return
     
     if delay_ms < 0:
@@ -526,11 +796,21 @@ def start_position_ramp(
     dt_s   = max(0.001, step_ms / 1000.0)
     steps  = max(1, math.ceil(dur_s / dt_s))
 
-    # First sample at t=0, last at t=dur_s; linear easing
-    for i in range(steps + 1):
-        a   = i / steps
-        pos = _lerp(start_pos, end_pos, a)
-        _enqueue_position(gid, pos, f, t, due_in_s=a * dur_s + delay_s)
+    # First sample at t=0, last at t=dur_s; linear easing.
+    # Deltas are computed once so each sample is three multiply-adds.
+    sx, sy, sz = start_pos
+    dx, dy, dz = _sub(end_pos, start_pos)
+    waapi_call_batch([
+        ("ak.soundengine.setPosition", {
+            "gameObject": gid,
+            "position": {
+                "position": {"x": sx + dx*a, "y": sy + dy*a, "z": sz + dz*a},
+                "orientationFront": front_dict,
+                "orientationTop":   top_dict,
+            }
+        }, a * dur_s + delay_s)
+        for a in (i / steps for i in range(steps + 1))
+    ])
 
 def create_game_obj(game_obj_name : str, position : Vec3) -> None: 
     return set_game_obj_position(game_obj_name, position[0], position[1], position[2])
@@ -538,13 +818,21 @@ def create_game_obj(game_obj_name : str, position : Vec3) -> None:
 def unregister_game_obj(name: str) -> None:
     id : int = ensure_game_obj(name)
     waapi_call("ak.soundengine.unregisterGameObj", {"gameObject": id})
+    _game_obj_cache_remove(int(id))
 
 def stop_all_sounds():
-    game_objs = get_all_game_objs_in_wwise_session().get("return",[])
-    
-    for game_obj in game_objs:
-        gid = game_obj["id"]
-        waapi_call("ak.soundengine.stopAll", {"gameObject": gid})
+    # No gameObject: the sound engine stops every game object in one call
+    waapi_call("ak.soundengine.stopAll", {})
+
+def stop_sounds_on(name: str) -> None:
+    # Lookup only: an unknown game object has nothing playing, so do not register one
+    with _go_cache_lock:
+        get_all_game_objs_in_wwise_session()
+        gid = _go_cache["by_name"].get(name.strip().lower()) if isinstance(name, str) else None
+    if gid is None:
+        logger.debug("stop_sounds_on: no game object named %r; nothing to stop", name)
+        return
+    waapi_call("ak.soundengine.stopAll", {"gameObject": gid})
  
 # ==============================================================================
 #             Creating, Listing & Posting Events in Wwise
@@ -561,6 +849,8 @@ EVENT_TYPES = {
 
 EVENT_TYPE_NAMES = list(EVENT_TYPES.keys()) 
 
+_VALID_EVENT_TYPES_MSG = ", ".join(sorted(EVENT_TYPES))
+
 OBJECTS_ALLOWEDEVENTS = {
     "ActorMixer"             :  EVENT_TYPE_NAMES[1:],
     "Bus"                    :  EVENT_TYPE_NAMES[1:],
@@ -599,7 +889,7 @@ def create_event(
     """
     
     # 1. Validate inputs
-    if not all([source_path, dst_parent_path, event_name, event_type]):
+    if not source_path or not dst_parent_path or not event_name or not event_type:
         raise WwiseValidationError("All parameters must be non-empty. "
         f"Received: source_path={bool(source_path)}, "
         f"dst_parent_path={bool(dst_parent_path)}, "
@@ -608,64 +898,69 @@ def create_event(
     )
 
     event_type = event_type.lower()
+    action_type = EVENT_TYPES.get(event_type)
 
-    if event_type not in EVENT_TYPES:
+    if action_type is None:
         raise WwiseValidationError(
         f"Invalid event_type '{event_type}'. "
-        f"Valid types: {', '.join(sorted(set(EVENT_TYPES.keys())))}")
+        f"Valid types: {_VALID_EVENT_TYPES_MSG}")
     
     try:
-        # 2. Resolve parent object
-        parent_ref = get_object_at_path(dst_parent_path)
+        # 2. Resolve parent and source objects in one lookup
+        resolved = get_objects_at_paths([dst_parent_path, source_path])
+
+        parent_ref = resolved.get(dst_parent_path)
         if not parent_ref: 
             raise WwiseObjectNotFoundError(f"Failed to create event: {event_name}. The parent path supplied is invalid. Please specify a valid parent path for the new event.")
         if "id" not in parent_ref or not parent_ref["id"]:
             raise WwiseApiError(f"Failed to create event: {event_name}. Parent destination object does not contain an id attribute or has no id. Please specify a valid parent path object.") 
         parent_id = parent_ref["id"]
 
-        # 3. Resolve source object
-        source_object = get_object_at_path(source_path)
+        # 3. Check source object
+        source_object = resolved.get(source_path)
         if not source_object:
             raise WwiseObjectNotFoundError(f"Failed to create event: {event_name}. Source Object does not exist. The provided source path is invalid.")
         if "id" not in source_object or not source_object["id"]:
             raise WwiseApiError(f"Source Object does not contain an id attribute or has no id. Please specify a valid source object.")
         source_object_id = source_object["id"]
 
-        # 4. Create event
-        event_response = waapi_call(
+        # 4. Create event and its action in one call (action as a nested child)
+        response = waapi_call(
             "ak.wwise.core.object.create", {
             "parent": parent_id,
             "type": "Event",
             "name": event_name, 
-            "onNameConflict": "rename"
+            "onNameConflict": "rename",
+            "children": [{
+                "type": "Action",
+                "name": event_name,
+                "@ActionType": action_type,
+                "@Target": source_object_id
+            }]
         })
 
-        if not event_response or "id" not in event_response or not event_response["id"]:
+        if not response or "id" not in response or not response["id"]:
             raise WwiseApiError(
                 f"Event creation for '{event_name}' returned invalid response",
                 operation="create_event",
-                details={"response": event_response}
+                details={"response": response}
             )
-        logger.info(f"Created event with ID: {event_response['id']}")
+        logger.info(f"Created event with ID: {response['id']}")
 
-        # 5. Create action
-        action_response = waapi_call(
-            "ak.wwise.core.object.create", {
-            "parent": event_response["id"],
-            "type": "Action",
-            "name": event_name,
-            "@ActionType": EVENT_TYPES[event_type],
-            "@Target": source_object_id
-        })
+        children = response.get("children") or []
+        action_response = children[0] if children else None
 
         if not action_response or "id" not in action_response:
             raise WwiseApiError(
                 f"Action creation for event '{event_name}' returned invalid response",
                 operation="create_action",
-                details={"response": action_response}
+                details={"response": response}
             )
         logger.info(f"Created action with ID: {action_response['id']}")
 
+        event_response = {k: v for k, v in response.items() if k != "children"}
+        invalidate_object_caches()
+
         return {
             "event": event_response,
             "action": action_response
@@ -686,6 +981,84 @@ def create_event(
             operation="create_event"
         ) from e
 
+# Object-tree change tracking shared by the memos below (name lists, path lookups).
+# Any object created/renamed/moved/deleted event drops them all; without those
+# subscriptions their short TTLs bound staleness instead.
+_OBJECT_CHANGE_TOPICS = (
+    "ak.wwise.core.object.created",
+    "ak.wwise.core.object.nameChanged",
+    "ak.wwise.core.object.childAdded",
+    "ak.wwise.core.object.childRemoved",
+    "ak.wwise.core.object.postDeleted",
+)
+_object_change_subs: dict[str, Any] = {"generation": None, "ids": None}
+# Guards the object memos below and the one-time subscribe; tool calls run on worker threads.
+_object_cache_lock = threading.RLock()
+
+def invalidate_object_caches() -> None:
+    """Drop every memoized object lookup (name lists, path -> object, subtrees, child names)."""
+    with _object_cache_lock:
+        _name_list_cache.clear()
+        _path_cache.clear()
+        _nodes_cache.clear()
+        _child_name_cache.clear()
+
+# Hit/miss counters for the path and subtree memos, reported by get_cache_stats().
+_cache_counters: dict[str, int] = {"path_hits": 0, "path_misses": 0, "nodes_hits": 0, "nodes_misses": 0}
+
+def get_cache_stats() -> dict:
+    """
+    Returns hit/miss counts and current sizes of the object lookup memos:
+        {"path": {"hits", "misses", "size"}, "nodes": {...}, "name_lists": {"size"}}
+    """
+    with _object_cache_lock:
+        return {
+            "path":  {"hits": _cache_counters["path_hits"], "misses": _cache_counters["path_misses"], "size": len(_path_cache)},
+            "nodes": {"hits": _cache_counters["nodes_hits"], "misses": _cache_counters["nodes_misses"], "size": len(_nodes_cache)},
+            "name_lists": {"size": len(_name_list_cache)},
+        }
+
+def _drain_object_changes() -> bool:
+    """Invalidate the object memos if change events arrived. Returns True when subscribed."""
+    with _object_cache_lock:
+        live = _subscribe_topics_once(_object_change_subs, _OBJECT_CHANGE_TOPICS)
+        if live:
+            changed = False
+            for sub_id in _object_change_subs["ids"].values():
+                changed |= bool(WwiseSession.waapi_subscription_events(sub_id))
+            if changed:
+                _name_list_cache.clear()
+                _path_cache.clear()
+                _nodes_cache.clear()
+                _child_name_cache.clear()
+        return live
+
+# Memo for the name-list queries below, keyed by (root, types, filter_spec); also
+# holds the game sync listings (tagged keys, dict rows copied in and out).
+_NAME_LIST_CACHE_TTL_S = 1.0
+_NAME_LIST_LIVE_TTL_S = 60.0
+_NAME_LIST_CACHE_MAX = 256
+_name_list_cache: dict[tuple, tuple[float, tuple[str, ...]]] = {}
+
+def _name_list_cache_get(key: tuple) -> list[str] | None:
+    live = _drain_object_changes()
+
+    with _object_cache_lock:
+        entry = _name_list_cache.get(key)
+        if entry is None:
+            return None
+        ttl = _NAME_LIST_LIVE_TTL_S if live else _NAME_LIST_CACHE_TTL_S
+        if time.monotonic() - entry[0] >= ttl:
+            _name_list_cache.pop(key, None)
+            return None
+    return list(entry[1])             # callers get their own copy
+
+def _name_list_cache_put(key: tuple, names: list[str]) -> None:
+    with _object_cache_lock:
+        if len(_name_list_cache) >= _NAME_LIST_CACHE_MAX:
+            _name_list_cache.pop(next(iter(_name_list_cache), None), None)   # oldest insertion
+        _name_list_cache[key] = (time.monotonic(), tuple(names))
+
 def list_all_event_names(
     filter_spec: str | None = None
 ) -> list[str]:
@@ -708,6 +1081,10 @@ def list_all_event_names(
     RuntimeError on WAAPI failure.
     """
     spec = (filter_spec or "").strip()
+    cache_key = (r"\Events", ("Event",), spec)
+    cached = _name_list_cache_get(cache_key)
+    if cached is not None:
+        return cached
 
     # 1️. decide the subtree we start from + optional name filter
     if spec.startswith("\\"):                 # absolute path
@@ -729,11 +1106,13 @@ def list_all_event_names(
     query_args = {"from": {"path": [start_path]}, "transform": transform}
     query_opts = {"return": ["name"]}
 
-    res = waapi_call("ak.wwise.core.object.get", query_args, options=query_opts)
+    res = _waapi_read("ak.wwise.core.object.get", query_args, options=query_opts)
     if not res or "return" not in res:
         raise RuntimeError("WAAPI call failed or returned no data")
 
-    return [obj["name"] for obj in res["return"]]
+    names = [obj["name"] for obj in res["return"]]
+    _name_list_cache_put(cache_key, names)
+    return names
 
 def post_event(
   event_name: str,
@@ -747,14 +1126,7 @@ def post_event(
   if not game_obj: 
     game_obj = DEFAULT_GAME_OBJ_NAME
 
-  ensure_game_obj(game_obj)
-  
-  if delay_ms < 0:
-    raise ValueError("delay_ms must be >= 0")
-  if not game_obj:
-    raise ValueError("game object name must not be null")
-
-  gid = ensure_game_obj(game_obj)  # your existing registrar / resolver
+  gid = ensure_game_obj(game_obj)
 
   waapi_call(
     "ak.soundengine.postEvent",
@@ -800,15 +1172,33 @@ def create_rtpc(
 
     Returns the WAAPI object dict (id, name, path, etc.).
     """
-    # 1) Create the Game Parameter object
-    created = waapi_call("ak.wwise.core.object.create", {
+    base_args = {
         "parent": parent,             
         "type": "GameParameter",
         "name": name,
         "onNameConflict": on_conflict 
-    })
+    }
+
+    # Fast path: range and default go inline as property overrides, one round-trip.
+    args = {**base_args, "@Min": float(vmin), "@Max": float(vmax)}
+    if default is not None:
+        args["@InitialValue"] = float(default)
+    try:
+        created = _waapi_read("ak.wwise.core.object.create", args)
+        invalidate_object_caches()
+        return created.get("return", created)
+    except WaapiRequestFailed:
+        # Older Authoring builds reject inline @Min/@Max; fall back to the 3-call path.
+        # A name conflict under on_conflict="fail" is a real error, not a rejected property.
+        if on_conflict == "fail" and name.casefold() in _child_names(parent):
+            raise
+        logger.debug("Inline @Min/@Max create rejected for RTPC %r; using setRange", name, exc_info=True)
+
+    # 1) Create the Game Parameter object
+    created = _waapi_read("ak.wwise.core.object.create", base_args)
     obj = created.get("return", created)  
     gid = obj["id"]
+    invalidate_object_caches()
 
     # 2) Set its numeric range
     payload = {
@@ -836,12 +1226,14 @@ def create_switch_or_state_types(
     type : str, # Switch, SwitchGroup, State, StateGroup
     on_conflict: str = "rename") -> dict:
     
-    return waapi_call("ak.wwise.core.object.create", {
+    res = waapi_call("ak.wwise.core.object.create", {
         "parent": parent_path,
         "type": type,
         "name": name,
         "onNameConflict": on_conflict
     })
+    invalidate_object_caches()
+    return res
 
 # ==============================================================================
 #         Game Syncs (States, Switches, Rtpcs) Setters in Wwise
@@ -938,14 +1330,18 @@ def ramp_rtpc(
     dt_s   = max(0.001, step_ms / 1000.0)
     steps  = max(1, math.ceil(dur_s / dt_s))
 
-    # Linear ramp
-    for i in range(steps + 1):
-        t = i / steps
-        value = start + (end - start) * t
-        waapi_call("ak.soundengine.setRTPCValue",
-                   {"rtpc": rtpc, "value": value, "gameObject": gid},
-                   due_in=t * dur_s,   # schedule relative to now
-                   wait=False)         # fire-and-forget
+    # Linear ramp, all steps enqueued at once (each scheduled relative to now).
+    # Per-step increments are computed once; the last sample is pinned to
+    # (end, dur_s) so rounding never leaves the RTPC short of its target.
+    base    = {"rtpc": rtpc, "gameObject": gid}
+    dv      = (end - start) / steps
+    step_s  = dur_s / steps
+    batch = [
+        ("ak.soundengine.setRTPCValue", {**base, "value": start + dv * i}, step_s * i)
+        for i in range(steps)
+    ]
+    batch.append(("ak.soundengine.setRTPCValue", {**base, "value": end}, dur_s))
+    waapi_call_batch(batch)
 
 # ==============================================================================
 #          Game Syncs (States, Switches, Rtpcs) Getters
@@ -986,6 +1382,10 @@ def list_gamesync_names(root : str, type : list[str], filter_spec: str | None =
     RuntimeError  – if the WAAPI query fails.
     """
     spec = (filter_spec or "").strip()
+    cache_key = (root, tuple(type), spec)
+    cached = _name_list_cache_get(cache_key)
+    if cached is not None:
+        return cached
 
     # Decide the subtree and optional name filter
     if spec.startswith("\\"):                 # absolute path
@@ -1003,13 +1403,15 @@ def list_gamesync_names(root : str, type : list[str], filter_spec: str | None =
         transform.append({"where": ["name:matches", name_cond]})
     transform.append({"where": ["type:isIn", type]})
 
-    query_args = {"from": {"path": [start_path]}, "transform": transform, "options": {"return": ["name"]}}
+    query_args = {"from": {"path": [start_path]}, "transform": transform}
 
-    res = waapi_call("ak.wwise.core.object.get", query_args)
+    res = _waapi_read("ak.wwise.core.object.get", query_args, options={"return": ["name"]})
     if not res or "return" not in res:
         raise RuntimeError("WAAPI call failed or returned no data")
 
-    return [obj["name"] for obj in res["return"]]
+    names = [obj["name"] for obj in res["return"]]
+    _name_list_cache_put(cache_key, names)
+    return names
 
 def list_all_rtpc_names(filter_spec: str | None = None) -> list[str]:
     return list_gamesync_names(GAME_PARAM_ROOT, RTPC_TYPE, filter_spec)
@@ -1027,6 +1429,10 @@ def get_all_gamesync_types(
         or [{"id": ..., "name": ..., "path": "..."}] if include_path=True
     """
     spec = (filter_spec or "").strip()
+    cache_key = ("gamesync_types", root_path, tuple(gamesync_child_types), spec, include_path)
+    cached = _name_list_cache_get(cache_key)
+    if cached is not None:
+        return [dict(o) for o in cached]
 
     # Build transform
     transform: list[dict] = [
@@ -1044,7 +1450,7 @@ def get_all_gamesync_types(
     ret_fields = ["id", "name"] + (["path"] if include_path else [])
     opts = {"return": ret_fields}
 
-    res = waapi_call("ak.wwise.core.object.get", args, options=opts)
+    res = _waapi_read("ak.wwise.core.object.get", args, options=opts)
 
     items = (res or {}).get("return")
     if not items:
@@ -1065,8 +1471,55 @@ def get_all_gamesync_types(
             out.append({"id": _id, "name": _name, "path": _path})
         else:
             out.append({"id": _id, "name": _name})
+    _name_list_cache_put(cache_key, [dict(o) for o in out])
+    return out
+
+def get_all_gamesync_types_with_parent(
+    root_path: str,
+    gamesync_child_types: list[str]
+) -> list[dict]:
+    """
+    Returns a list like:
+        [{"id": "<GUID>", "name": "<ChildName>", "parent_id": "<GUID>", "parent_name": "<GroupName>"}]
+    using a single object.get (children and their parents come back together).
+    """
+    cache_key = ("gamesync_types_with_parent", root_path, tuple(gamesync_child_types))
+    cached = _name_list_cache_get(cache_key)
+    if cached is not None:
+        return [dict(o) for o in cached]
+
+    args = {
+        "from": {"path": [root_path]},
+        "transform": [
+            {"select": ["descendants"]},
+            {"where": ["type:isIn", gamesync_child_types]},
+        ],
+    }
+    opts = {"return": ["id", "name", "parent"]}
+
+    res = _waapi_read("ak.wwise.core.object.get", args, options=opts)
+
+    if not res or "return" not in res:
+        raise RuntimeError("WAAPI ak.wwise.core.object.get returned no 'return' field")
+
+    out = []
+    for o in res["return"]:
+        _id = o.get("id")
+        _name = o.get("name")
+        parent_id, parent_name = _parent_fields(o)
+        if not (_id and _name and parent_id and parent_name):
+            continue
+        out.append({"id": _id, "name": _name, "parent_id": parent_id, "parent_name": parent_name})
+    _name_list_cache_put(cache_key, [dict(o) for o in out])
     return out
 
+def _parent_fields(obj: dict) -> tuple[str | None, str | None]:
+    """Read (parent id, parent name) from an object.get row that returned 'parent' (object) or 'parent.id'/'parent.name'."""
+    parent = obj.get("parent")
+    if isinstance(parent, dict):
+        return parent.get("id"), parent.get("name")
+    return obj.get("parent.id"), obj.get("parent.name")
+
 def get_parent_map_for_gamesync_child_ids(gamesync_child_ids: Iterable[str]) -> dict[str, tuple[str, str] | None]:
     """
     For each child_id, returns (parent_id, parent_name).
@@ -1078,35 +1531,54 @@ def get_parent_map_for_gamesync_child_ids(gamesync_child_ids: Iterable[str]) ->
         return {}
 
     parent_map: dict[str, tuple[str, str] | None] = {}
+
+    # batch: one query for every child, returning each child's parent ----------
+    try:
+        res = _waapi_read(
+            "ak.wwise.core.object.get",
+            {"from": {"id": gamesync_child_ids}},
+            {"return": ["id", "parent"]}
+        )
+        for o in (res or {}).get("return", []):
+            parent_id, parent_nm = _parent_fields(o)
+            if o.get("id") and parent_id and parent_nm:
+                parent_map[o["id"]] = (parent_id, parent_nm)
+        for sid in gamesync_child_ids:
+            parent_map.setdefault(sid, None)
+        return parent_map
+    except WaapiRequestFailed:
+        # e.g. one unknown ID rejects the whole query; timeouts and drops propagate
+        logger.debug("Batched parent lookup rejected; falling back to per-ID queries", exc_info=True)
+        parent_map.clear()
     
-    # per-ID, select the parent then read its fields ----------
-    for sid in gamesync_child_ids:
-        try:
-            args = {
-                "from": {"id": [sid]},
-                "transform": [
-                    {"select": ["parent"]}  # move selection to the parent object
-                ],
-            }
-            # ask for id + name (type/path optional if your build returns them)
-            opts = {"return": ["id", "name"]}
-            res = waapi_call("ak.wwise.core.object.get", args, opts)
-            items = (res or {}).get("return", [])
-
-            if items:
-                parent_id = items[0].get("id")
-                parent_nm = items[0].get("name")
-                if parent_id and parent_nm:
-                    parent_map[sid] = (parent_id, parent_nm)
-                    continue
-
-            parent_map[sid] = None  # couldn't resolve
-        except Exception:
-            parent_map[sid] = None
+    # fallback: per-ID, select the parent then read its fields ----------
+    # (pipelined: every query is enqueued at once, replies read in order)
+    # ask for id + name (type/path optional if your build returns them)
+    opts = {"return": ["id", "name"]}
+    responses = waapi_call_many(
+        [
+            ("ak.wwise.core.object.get",
+             {"from": {"id": [sid]}, "transform": [{"select": ["parent"]}]},  # move selection to the parent object
+             opts)
+            for sid in gamesync_child_ids
+        ],
+        return_exceptions=True
+    )
+
+    for sid, res in zip(gamesync_child_ids, responses):
+        parent_map[sid] = None  # couldn't resolve
+        if isinstance(res, BaseException):
+            continue
+        items = (res or {}).get("return", [])
+        if items:
+            parent_id = items[0].get("id")
+            parent_nm = items[0].get("name")
+            if parent_id and parent_nm:
+                parent_map[sid] = (parent_id, parent_nm)
 
     return parent_map
 
-def build_state_groups_from_list(gamesync_children : list[dict], parent_map : dict[str, tuple[str, str] | None])-> dict[str, str] : 
+def build_state_groups_from_list(gamesync_children : list[dict], parent_map : dict[str, tuple[str, str] | None])-> list[list[str]] : 
     groups: dict[str, list[str]] = {}
     
     for s in gamesync_children:
@@ -1117,26 +1589,19 @@ def build_state_groups_from_list(gamesync_children : list[dict], parent_map : di
         _, gname = parent
         groups.setdefault(gname, []).append(sname)
 
-    result = [[gname, *sorted(snames, key=str.casefold)]
-            for gname, snames in groups.items()]
-    result.sort(key=lambda row: row[0].casefold())
-
-    return result 
+    # Sort keys are computed once per element; str.casefold is called directly
+    # rather than through a per-row lambda.
+    return [[gname, *sorted(groups[gname], key=str.casefold)]
+            for gname in sorted(groups, key=str.casefold)]
 
 def get_all_gamesyncgroups_and_gamesyncs_grouped(root_path : str, gamesync_child_types : list[str]) -> dict[str, list[str]]:
     """
     Returns {StateGroupName: [StateName, ...]}.
     """
-    gamesyncs = get_all_gamesync_types(root_path, gamesync_child_types)
-    parent_map = get_parent_map_for_gamesync_child_ids([s["id"] for s in gamesyncs])
     groups: dict[str, list[str]] = {}
 
-    for s in gamesyncs:
-        parent = parent_map.get(s["id"])
-        if not parent:
-            continue
-        _, gname = parent
-        groups.setdefault(gname, []).append(s["name"])
+    for s in get_all_gamesync_types_with_parent(root_path, gamesync_child_types):
+        groups.setdefault(s["parent_name"], []).append(s["name"])
 
     for g in groups:
         groups[g].sort(key=str.casefold)
@@ -1164,43 +1629,35 @@ def get_selected_objects() -> list[dict]:
     """
     operation = "ak.wwise.ui.getSelectedObjects"
     
+    response = _call(operation, {}, what="fetching selected objects")
+    
     try:
-        response = waapi_call(operation, {})
-        
-        if not isinstance(response, dict):
-            raise WwiseApiError(
-                f"WAAPI returned unexpected type: {type(response).__name__}",
-                operation=operation,
-                details={"response_type": type(response).__name__}
-            )
-
         objs = response.get("objects", [])
-        
-        if not isinstance(objs, list):
-            raise WwiseApiError(
-                f"'objects' field is not a list: {type(objs).__name__}",
-                operation=operation,
-                details={"objects_type": type(objs).__name__}
-            )
-        
-        return objs
-    
-    except (WwisePyLibError):
-        raise
+    except AttributeError:
+        raise WwiseApiError(
+            f"WAAPI returned unexpected type: {type(response).__name__}",
+            operation=operation,
+            details={"response_type": type(response).__name__}
+        ) from None
     
-    except Exception as e:
+    if _WAAPI_STRICT and not isinstance(objs, list):
         raise WwiseApiError(
-            f"Unexpected error: {str(e)}",
+            f"'objects' field is not a list: {type(objs).__name__}",
             operation=operation,
-            details={
-                "error_type": type(e).__name__,
-                "error_message": str(e)
-            }
-        ) from e
+            details={"objects_type": type(objs).__name__}
+        )
+    
+    return objs
+
+# Max IDs per object.get in the field getters; bounds each response (and its parse)
+# on very large projects.
+_FIELDS_PAGE_SIZE = 5000
 
 def get_fields_from_objects(
     object_ids: list[str], 
-    fields: list[str]
+    fields: list[str],
+    *,
+    page_size: int = _FIELDS_PAGE_SIZE
 ) -> list[dict]:
     """
     Retrieve specified fields from Wwise objects given their IDs.
@@ -1209,58 +1666,145 @@ def get_fields_from_objects(
         object_ids: List of Wwise object GUIDs.
         fields: List of field names to retrieve (e.g., ['name', 'type', 'path']).
         'children' field is automatically filtered out.
+        Duplicate IDs and fields are sent once (first-seen order kept).
+        page_size: Max IDs per WAAPI call; larger lists are split into pipelined calls.
     
     Returns:
-        list[dict]: List of objects with requested fields.
+        list[dict]: List of objects with requested fields, one per distinct ID.
         
     Raises:
         WwiseValidationError: If object_ids or fields are empty.
         WwiseApiError: If the WAAPI call fails.
     """
+    unique_ids, clean_fields = _fields_request(object_ids, fields, page_size)
+
+    if len(unique_ids) <= page_size:
+        return _fetch_fields_page(unique_ids, clean_fields)
+
+    try:
+        responses = waapi_call_many(
+            ("ak.wwise.core.object.get",
+             {"from": {"id": unique_ids[start:start + page_size]}, "options": {"return": clean_fields}},
+             None)
+            for start in range(0, len(unique_ids), page_size)
+        )
+    except WwisePyLibError:
+        raise
+    except Exception as e:
+        raise WwiseApiError(
+            f"Unexpected error fetching object fields: {str(e)}",
+            operation="ak.wwise.core.object.get",
+            details={"error_type": type(e).__name__, "object_ids": unique_ids, "fields": clean_fields}
+        ) from e
+
+    return [row for response in responses for row in (response or {}).get("return", [])]
+
+def _fields_request(object_ids: list[str], fields: list[str], page_size: int) -> tuple[list[str], list[str]]:
+    """Validate and deduplicate a field request. Returns (unique_ids, clean_fields)."""
     if not object_ids:
         raise WwiseValidationError("object_ids list cannot be empty")
     
     if not fields:
         raise WwiseValidationError("fields list cannot be empty")
+
+    if page_size < 1:
+        raise WwiseValidationError("page_size must be >= 1", field="page_size", value=page_size)
     
     # Filter out 'children' field as it's not supported in this context
-    clean_fields = [f for f in fields if f.lower() != "children"]
+    clean_fields = list(dict.fromkeys(f for f in fields if f.lower() != "children"))
     
     if not clean_fields:
         raise WwiseValidationError(
             "No valid fields remaining after filtering (only 'children' was provided)"
         )
     
+    # Selections merged with descendants often repeat IDs; each is fetched once
+    return list(dict.fromkeys(object_ids)), clean_fields
+
+def _fetch_fields_page(ids: list[str], clean_fields: list[str]) -> list[dict]:
     args = {
-        "from": {"id": object_ids},
+        "from": {"id": ids},
         "options": {"return": clean_fields}
     }
     
-    try:
-        response = waapi_call("ak.wwise.core.object.get", args)
-        
-        if response is None:
-            raise WwiseApiError(
-                "WAAPI returned None when fetching object fields",
-                operation="ak.wwise.core.object.get",
-                details={"object_ids": object_ids, "fields": clean_fields}
-            )
+    response = _call("ak.wwise.core.object.get", args, what="fetching object fields",
+                     object_ids=ids, fields=clean_fields)
+    
+    if response is None:
+        raise WwiseApiError(
+            "WAAPI returned None when fetching object fields",
+            operation="ak.wwise.core.object.get",
+            details={"object_ids": ids, "fields": clean_fields}
+        )
+    
+    return response.get("return", [])
+
+def _path_key(path: str) -> str:
+    """Normalize a Wwise path for matching (Wwise paths are case-insensitive)."""
+    return "\\" + path.strip().strip("\\").casefold()
+
+def get_objects_at_paths(paths: list[str]) -> dict[str, dict]:
+    """
+    Resolve several Wwise object paths with a single ak.wwise.core.object.get call.
+    
+    Args:
+        paths: Full Wwise object paths. Duplicates are resolved once.
+    
+    Returns:
+        dict[str, dict]: Maps each requested path (as given) to its object info
+                         ('id', 'name', 'type', 'path'). Paths with no object are omitted.
         
-        return response.get("return", [])
+    Raises:
+        WwiseValidationError: If any path is empty.
+        WwiseApiError: If the WAAPI call fails.
+    """
+    for i, path in enumerate(paths):
+        if not path or not path.strip():
+            raise WwiseValidationError(f"Object path at index {i} cannot be empty")
     
-    except WwisePyLibError:
-        raise
+    unique_paths = list(dict.fromkeys(paths))
     
-    except Exception as e:
+    try:
+        response = _waapi_read(
+            "ak.wwise.core.object.get",
+            {"from": {"path": unique_paths}},
+            {"return": ["id", "name", "type", "path"]}
+        )
+    except WaapiRequestFailed:
+        # WAAPI rejects the whole request if one path is unknown; resolve one by one
+        # instead (get_object_at_path reports the unknown ones as not found)
+        found: dict[str, dict] = {}
+        for path in unique_paths:
+            try:
+                found[path] = get_object_at_path(path)
+            except WwiseObjectNotFoundError:
+                continue
+        return found
+    
+    if response is None:
         raise WwiseApiError(
-            f"Unexpected error fetching object fields: {str(e)}",
+            "WAAPI returned None when retrieving objects by path",
             operation="ak.wwise.core.object.get",
-            details={
-                "error_type": type(e).__name__,
-                "object_ids": object_ids,
-                "fields": clean_fields
-            }
+            details={"paths": unique_paths}
         )
+    
+    by_key = {_path_key(obj["path"]): obj for obj in response.get("return", []) if obj.get("path")}
+    
+    return {
+        path: by_key[_path_key(path)]
+        for path in unique_paths
+        if _path_key(path) in by_key
+    }
+
+# Memo for get_object_at_path(), keyed by _path_key(). Only hits are stored;
+# dropped by invalidate_object_caches() and by object change events. Entries are
+# re-inserted on hit, so eviction drops the least recently used path.
+_PATH_CACHE_TTL_S = 1.0
+_PATH_CACHE_MAX = 256
+_path_cache: dict[str, tuple[float, dict]] = {}
+# Misses in flight, so concurrent tool calls for the same path share one object.get
+_path_inflight: dict[str, Future] = {}
+_path_inflight_lock = threading.Lock()
 
 def get_object_at_path(path: str) -> dict:
     """
@@ -1280,43 +1824,108 @@ def get_object_at_path(path: str) -> dict:
     if not path or not path.strip():
         raise WwiseValidationError("Object path cannot be empty")
     
+    _drain_object_changes()
+    key = _path_key(path)
+    with _object_cache_lock:
+        entry = _path_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _PATH_CACHE_TTL_S:
+            _path_cache.pop(key, None)    # most recently used goes last
+            _path_cache[key] = entry
+            _cache_counters["path_hits"] += 1
+            return dict(entry[1])
+        _cache_counters["path_misses"] += 1
+
+    with _path_inflight_lock:
+        pending = _path_inflight.get(key)
+        if pending is None:
+            _path_inflight[key] = future = Future()
+    if pending is not None:
+        return dict(pending.result())      # re-raises the leader's error
+
+    try:
+        obj = _get_object_at_path_uncached(path, key)
+        future.set_result(dict(obj))
+        return obj
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _path_inflight_lock:
+            del _path_inflight[key]
+
+def _get_object_at_path_uncached(path: str, key: str) -> dict:
     args = {
         "from": {"path": [path]},
         "options": {"return": ["id", "name", "type", "path"]}
     }
     
     try:
-        response = waapi_call("ak.wwise.core.object.get", args)
-        
-        if response is None:
-            raise WwiseApiError(
-                "WAAPI returned None when retrieving object by path",
-                operation="ak.wwise.core.object.get",
-                details={"path": path}
-            )
-        
-        objects = response.get("return", [])
-        
-        if not objects:
-            raise WwiseObjectNotFoundError(
-                f"No object found at path: {path}",
-                path=path
-            )
-        
-        return objects[0]
-    
-    except WwisePyLibError:
+        response = _call("ak.wwise.core.object.get", args, what="retrieving object at path", path=path)
+    except WwiseApiError as e:
+        if isinstance(e.__cause__, WaapiRequestFailed):
+            # object.get rejects an unknown path outright instead of returning no objects
+            raise WwiseObjectNotFoundError(f"No object found at path: {path}", path=path) from e.__cause__
         raise
     
-    except Exception as e:
+    if response is None:
         raise WwiseApiError(
-            f"Unexpected error retrieving object at path: {str(e)}",
+            "WAAPI returned None when retrieving object by path",
             operation="ak.wwise.core.object.get",
-            details={
-                "error_type": type(e).__name__,
-                "path": path
-            }
+            details={"path": path}
+        )
+    
+    objects = response.get("return", [])
+    
+    if not objects:
+        raise WwiseObjectNotFoundError(
+            f"No object found at path: {path}",
+            path=path
         )
+    
+    _path_cache_put(key, objects[0])
+    return objects[0]
+
+def _path_cache_put(key: str, obj: dict) -> None:
+    with _object_cache_lock:
+        if len(_path_cache) >= _PATH_CACHE_MAX:
+            _path_cache.pop(next(iter(_path_cache), None), None)   # least recently used
+        _path_cache[key] = (time.monotonic(), dict(obj))
+
+def _resolve_paths_bulk(paths: list[str]) -> dict[str, str]:
+    """
+    Map each path to its object id. Paths still in the get_object_at_path() memo
+    are served from it; the rest are resolved with one object.get and memoized.
+    
+    Raises:
+        WwiseValidationError: If a path is empty.
+        WwiseObjectNotFoundError: For the first path that does not resolve.
+    """
+    _drain_object_changes()
+    now = time.monotonic()
+    ids: dict[str, str] = {}
+    missing: list[str] = []
+    for path in dict.fromkeys(paths):
+        if not path or not path.strip():
+            raise WwiseValidationError("Object path cannot be empty")
+        with _object_cache_lock:
+            entry = _path_cache.get(_path_key(path))
+            if entry is not None and now - entry[0] < _PATH_CACHE_TTL_S:
+                _cache_counters["path_hits"] += 1
+                ids[path] = entry[1]["id"]
+            else:
+                missing.append(path)
+
+    if missing:
+        with _object_cache_lock:
+            _cache_counters["path_misses"] += len(missing)
+        found = get_objects_at_paths(missing)
+        for path in missing:
+            obj = found.get(path)
+            if obj is None:
+                raise WwiseObjectNotFoundError(f"No object found at path: {path}", path=path)
+            _path_cache_put(_path_key(path), obj)
+            ids[path] = obj["id"]
+    return ids
 
 # ==============================================================================
 #                   Editing Objects in Wwise 
@@ -1329,9 +1938,12 @@ def rename_objects(
     """
     Rename multiple Wwise objects.
     
-    Note: This operation is NOT atomic. If a failure occurs, all previous
-    renames will have succeeded. The returned list contains IDs of 
-    successfully renamed objects before the failure.
+    All renames are sent in a single ak.wwise.core.object.set call, which
+    Wwise applies all or nothing. If Wwise rejects that call (older Authoring,
+    or a bad name), falls back to one setName per object, pipelined; when any
+    of those fail, the ones that succeeded are renamed back before raising.
+    Timeouts and connection errors are raised as is, since the set may have
+    been applied.
 
     Args:
         objects: List of Wwise object dicts (must contain 'id' field).
@@ -1356,40 +1968,61 @@ def rename_objects(
         )
     
     # Validate all objects have 'id' field before attempting any operations
-    for i, obj in enumerate(objects):
-        if not isinstance(obj, dict) or "id" not in obj:
-            raise WwiseValidationError(
-                f"Object at index {i} is missing 'id' field"
-            )
-    
-    result: list[str] = []
-    
-    for i, (obj, new_name) in enumerate(zip(objects, names)):
-        try:
-            response = waapi_call(
-                "ak.wwise.core.object.setName",
-                {"object": obj["id"], "value": new_name}
-            )
-            
-            # Assuming the response contains the object ID on success
-            result.append(obj["id"])
-        
-        except WwisePyLibError:
-            raise
-        
-        except Exception as e:
-            raise WwiseApiError(
-                f"Failed to rename object at index {i}: {str(e)}",
-                operation="ak.wwise.core.object.setName",
-                details={
-                    "error_type": type(e).__name__,
-                    "object_id": obj["id"],
-                    "new_name": new_name,
-                    "index": i
-                }
-            )
+    bad = next((i for i, obj in enumerate(objects) if not (isinstance(obj, dict) and "id" in obj)), None)
+    if bad is not None:
+        raise WwiseValidationError(
+            f"Object at index {bad} is missing 'id' field"
+        )
     
-    return result
+    ids = [obj["id"] for obj in objects]
+
+    # One round-trip for the whole list
+    try:
+        _waapi_read(
+            "ak.wwise.core.object.set",
+            {"objects": [{"object": gid, "name": new_name} for gid, new_name in zip(ids, names)]},
+            timeout=_set_timeout(len(ids))
+        )
+        invalidate_object_caches()
+        return ids
+    except WaapiRequestFailed:
+        logger.debug("object.set rename rejected; renaming one object at a time", exc_info=True)
+
+    # Current names first, so that a partial run below can be put back
+    listed = _waapi_read("ak.wwise.core.object.get", {"from": {"id": ids}}, {"return": ["id", "name"]})
+    old_names = {obj["id"]: obj["name"] for obj in (listed or {}).get("return", [])}
+
+    # Even a partial run below changes paths
+    invalidate_object_caches()
+    responses = waapi_call_many(
+        [("ak.wwise.core.object.setName", {"object": gid, "value": new_name}, None)
+         for gid, new_name in zip(ids, names)],
+        return_exceptions=True
+    )
+    i = next((i for i, response in enumerate(responses) if isinstance(response, BaseException)), None)
+    if i is None:
+        return ids
+
+    renamed = [gid for gid, response in zip(ids, responses)
+               if not isinstance(response, BaseException) and gid in old_names]
+    reverts = waapi_call_many(
+        [("ak.wwise.core.object.setName", {"object": gid, "value": old_names[gid]}, None) for gid in renamed],
+        return_exceptions=True
+    )
+    not_reverted = [gid for gid, response in zip(renamed, reverts) if isinstance(response, BaseException)]
+    not_reverted += [gid for gid, response in zip(ids, responses)
+                     if not isinstance(response, BaseException) and gid not in old_names]
+    raise WwiseApiError(
+        f"Failed to rename object at index {i}: {str(responses[i])}",
+        operation="ak.wwise.core.object.setName",
+        details={
+            "error_type": type(responses[i]).__name__,
+            "object_id": ids[i],
+            "new_name": names[i],
+            "index": i,
+            "not_reverted_ids": not_reverted
+        }
+    ) from responses[i]
 
 def set_reference(
     object_path: str,
@@ -1446,6 +2079,8 @@ def set_property(
             "property": property_name, 
             "value": value})
 
+_MOVED_OBJECT_RETURN = ["id", "name", "path"]
+
 def move_object_by_path(source_path: str, dst_path: str):
     """
     Move an object (by its path) to a new parent (by path).
@@ -1453,27 +2088,38 @@ def move_object_by_path(source_path: str, dst_path: str):
     Returns the WAAPI move result dict (id,name,path).
     """
 
-    src_obj = get_object_at_path(source_path)
+    # Both endpoints in one object.get
+    found = get_objects_at_paths([source_path, dst_path])
+
+    src_obj = found.get(source_path)
     if not src_obj: 
-        raise ValueError(f"Source path not found: {source_path}")
+        raise WwiseObjectNotFoundError(f"Object not found at path: {source_path}", path=source_path)
     src_id = src_obj["id"]
 
-    dst_obj = get_object_at_path(dst_path)
+    dst_obj = found.get(dst_path)
     if not dst_obj: 
-        raise ValueError(f"Destination path not found: {dst_path}")
+        raise WwiseObjectNotFoundError(f"Object not found at path: {dst_path}", path=dst_path)
     dst_id = dst_obj["id"]
 
-    res = waapi_call("ak.wwise.core.object.move", args={"object": src_id, "parent": dst_id})
+    res = waapi_call("ak.wwise.core.object.move", 
+                     args={"object": src_id, "parent": dst_id},
+                     options={"return": _MOVED_OBJECT_RETURN})
 
     if not isinstance(res, dict):
         raise RuntimeError(f"Move failed: {res}")
 
-    # res only contains id and name. 
+    invalidate_object_caches()
+
+    # Authoring builds that honour the return options hand back the path directly
+    if "path" in res:
+        return {"return": [{k: res[k] for k in _MOVED_OBJECT_RETURN if k in res}]}
+
+    # Otherwise res only contains id and name. 
     moved_id = res["id"]   
     moved = waapi_call(
     "ak.wwise.core.object.get",
     args={"from": {"id": [moved_id]}},                     
-    options={"options": {"return": ["id", "name", "path"]}},
+    options={"return": _MOVED_OBJECT_RETURN},
     )
 
     return moved
@@ -1482,21 +2128,63 @@ def move_object_by_path(source_path: str, dst_path: str):
 #           Resolving Path Structures in Wwise
 # ==============================================================================
 
-def fetch_nodes(parent_path : str) -> str:
+# Memo for fetch_nodes(), keyed by _path_key(parent_path); same lifetime rules as _path_cache.
+_NODES_CACHE_MAX = 64
+_nodes_cache: dict[str, tuple[float, tuple[dict, ...]]] = {}
+
+def fetch_nodes(parent_path : str) -> list[dict]:
+    _drain_object_changes()
+    key = _path_key(parent_path)
+    with _object_cache_lock:
+        entry = _nodes_cache.pop(key, None)
+        if entry is not None and time.monotonic() - entry[0] < _PATH_CACHE_TTL_S:
+            _nodes_cache[key] = entry
+            _cache_counters["nodes_hits"] += 1
+            return [dict(n) for n in entry[1]]
+        _cache_counters["nodes_misses"] += 1
+
+    nodes = _fetch_nodes_uncached(parent_path)
+    _seed_child_names(nodes)
+    with _object_cache_lock:
+        if len(_nodes_cache) >= _NODES_CACHE_MAX:
+            _nodes_cache.pop(next(iter(_nodes_cache), None), None)
+        _nodes_cache[key] = (time.monotonic(), tuple(dict(n) for n in nodes))
+    return nodes
+
+def _fetch_nodes_uncached(parent_path : str) -> list[dict]:
     return_fields = ["id","name","path"]
     
-    # 1) Grab the parent root (this returns exactly one object)
-    args1 = {"from": { "path": [parent_path]}}
-    opts1 = {"return": return_fields }
-    root_res = waapi_call("ak.wwise.core.object.get", args1, opts1)
+    # 1) Root + all descendants in one query (the JSON transform has no "self" selector; WAQL does)
+    if '"' not in parent_path:
+        try:
+            res = _waapi_read("ak.wwise.core.object.get",
+                              {"waql": f'"{parent_path}" select this, descendants'},
+                              {"return": return_fields})
+            nodes = res.get("return", [])
+            # Keep the root first, as callers expect
+            root_key = _path_key(parent_path)
+            for i, node in enumerate(nodes):
+                if _path_key(node.get("path", "")) == root_key:
+                    if i:
+                        nodes.insert(0, nodes.pop(i))
+                    break
+            return nodes
+        except WaapiRequestFailed:
+            # Older Authoring without WAQL; transport errors propagate, the fallback would fail too
+            logger.debug("WAQL fetch rejected for %r; falling back to two queries", parent_path, exc_info=True)
+
+    # 2) Fallback: the parent root (exactly one object) and its descendants
+    #    (single selector only), pipelined as two calls. waapi_call_many() always
+    #    sends immediately, even inside a WaapiBatch.
+    root_res, desc_res = waapi_call_many([
+        ("ak.wwise.core.object.get", {"from": {"path": [parent_path]}}, {"return": return_fields}),
+        ("ak.wwise.core.object.get",
+         {"from": {"path": [parent_path]}, "transform": [{"select": ["descendants"]}]},
+         {"return": return_fields}),
+    ])
 
     root_list = root_res.get("return", [])
     root = root_list[0] if root_list else None
-
-    # 2) Get all descendants (single selector only)
-    args2 = {"from": { "path": [parent_path] }, "transform": [{"select": ["descendants"]}]}
-    opts2 = {"return": return_fields}
-    desc_res = waapi_call("ak.wwise.core.object.get", args2, opts2)
     descendants = desc_res.get("return", [])
 
     # 3) Combine (root + descendants)
@@ -1507,6 +2195,26 @@ def fetch_nodes(parent_path : str) -> str:
 # ==============================================================================
 
 AUDIO_EXTS = {".wav", ".aiff", ".aif", ".ogg"} 
+# Same extensions for str.endswith() on lowercased names (hot loops)
+_AUDIO_EXT_TUPLE = tuple(sorted(AUDIO_EXTS))
+# Max files per ak.wwise.core.audio.import call; keeps each WAMP message and
+# Authoring transaction bounded on large imports.
+_IMPORT_CHUNK_SIZE = 512
+# Source paths are resolved on a small pool once a batch is large enough for the
+# realpath/stat syscalls to matter (network drives in particular).
+_IMPORT_RESOLVE_MIN_PARALLEL = 32
+_IMPORT_RESOLVE_WORKERS = 16
+
+def _resolve_audio_source(src: str) -> str:
+    # plain os.path string ops: same result as Path(src).expanduser().resolve(),
+    # without building pathlib objects per file
+    src_path = os.path.realpath(os.path.expanduser(src))
+    if not os.path.exists(src_path):
+        raise FileNotFoundError(f"Source file does not exist: {src_path}")
+
+    if not src_path.lower().endswith(_AUDIO_EXT_TUPLE):
+        raise ValueError(f"Not a supported audio file: {src_path}")
+    return src_path
 
 def import_audio_files(
     source_files: list[str],
@@ -1531,49 +2239,74 @@ def import_audio_files(
     if len(source_files) != len(destination_paths):
         raise ValueError("source_files and destination_paths must have the same length")
 
-    imports: list[dict] = []
-
-    for src, dest in zip(source_files, destination_paths):
-        # --- normalize & validate source file path ---
-        src_path = Path(src).expanduser().resolve()
-        if not src_path.exists():
-            raise FileNotFoundError(f"Source file does not exist: {src_path}")
-
-        if src_path.suffix.lower() not in AUDIO_EXTS:
-            raise ValueError(f"Not a supported audio file: {src_path}")
-
-        # --- normalize destination Wwise object path ---
-        # ensure exactly one leading backslash, no trailing backslash
-        object_path = "\\" + dest.strip("\\")
-
-        imports.append(
-            {
-                "audioFile": str(src_path),
-                "objectPath": object_path,
-            }
-        )
+    # --- normalize & validate source file paths ---
+    # map() yields in input order, so the first invalid file is still the one reported
+    if len(source_files) >= _IMPORT_RESOLVE_MIN_PARALLEL:
+        with ThreadPoolExecutor(max_workers=_IMPORT_RESOLVE_WORKERS) as pool:
+            src_paths = list(pool.map(_resolve_audio_source, source_files))
+    else:
+        src_paths = [_resolve_audio_source(src) for src in source_files]
+
+    # --- normalize destination Wwise object paths ---
+    # ensure exactly one leading backslash, no trailing backslash
+    imports: list[dict] = [
+        {
+            "audioFile": src_path,
+            "objectPath": "\\" + dest.strip("\\"),
+        }
+        for src_path, dest in zip(src_paths, destination_paths)
+    ]
 
     if not imports:
         raise ValueError("No valid audio files provided")
 
-    # --- WAAPI call ---
-    args = {
-        "importOperation": import_operation,  # "useExisting" / "createNew" / "replaceExisting"
-        "default": {
-            "importLanguage": language,
-            "objectType": "Sound",
-            "originalsSubFolder": originals_sub,
-        },
-        "imports": imports,
+    # --- WAAPI calls: bounded chunks, pipelined through the dispatcher ---
+    default = {
+        "importLanguage": language,
+        "objectType": "Sound",
+        "originalsSubFolder": originals_sub,
     }
+    options = {"return": ["id", "name", "path"]}
 
-    res = waapi_call(
-        "ak.wwise.core.audio.import",
-        args,
-        options={"return": ["id", "name", "path"]},
-    )
+    try:
+        responses = waapi_call_many(
+            [
+                ("ak.wwise.core.audio.import",
+                 {
+                     "importOperation": import_operation,  # "useExisting" / "createNew" / "replaceExisting"
+                     "default": default,
+                     "imports": imports[start:start + _IMPORT_CHUNK_SIZE],
+                 },
+                 options)
+                for start in range(0, len(imports), _IMPORT_CHUNK_SIZE)
+            ]
+        )
+    finally:
+        # Earlier chunks may have landed even if a later one failed
+        invalidate_object_caches()
+
+    return [obj for res in responses for obj in res["objects"]]
 
-    return res["objects"]   
+# Directory listings are latency-bound (network shares, cold caches); each level of
+# the tree is scanned on this many threads.
+_SCAN_WORKERS = 8
+
+def _scan_audio_dir(path: str, include_hidden: bool) -> tuple[list[str], list[str]]:
+    """Return (audio files, subdirectories) directly under path."""
+    files: list[str] = []
+    subdirs: list[str] = []
+    # os.scandir reuses the d_type from the directory listing, so entries are
+    # classified without a stat per file; hidden dirs are pruned, not walked.
+    # entry.path is already the joined string, so no Path is built per file.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not include_hidden and entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.lower().endswith(_AUDIO_EXT_TUPLE) and entry.is_file():
+                files.append(entry.path)
+    return files, subdirs
 
 def list_audio_files_at_path_file_explorer(
     root_path : str,
@@ -1588,24 +2321,70 @@ def list_audio_files_at_path_file_explorer(
     if not root_path.exists():
         raise FileNotFoundError(root_path)
 
-    it: Iterable[Path] = root_path.rglob("*") if recurse else root_path.iterdir()
-
-    def is_hidden(p: Path) -> bool:
-        # cross-platform-ish hidden check (dotfiles). Windows attributes need extra work if you care.
-        return any(part.startswith(".") for part in p.parts)
-
-    files: list[str] = []
-
-    for p in it:
-        if p.is_file() and p.suffix.lower() in AUDIO_EXTS:
-            if include_hidden or not is_hidden(p):
-                files.append(p)
+    # cross-platform-ish hidden check (dotfiles). Windows attributes need extra work if you care.
+    if not include_hidden and any(part.startswith(".") for part in root_path.parts):
+        return []
+
+    files, level = _scan_audio_dir(str(root_path), include_hidden)
+    if not recurse or not level:
+        return files
+
+    # Breadth-first: every directory of a level is listed concurrently
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+        while level:
+            next_level: list[str] = []
+            for sub_files, sub_dirs in pool.map(_scan_audio_dir, level, itertools.repeat(include_hidden)):
+                files.extend(sub_files)
+                next_level.extend(sub_dirs)
+            level = next_level
     return files
 
 # ==============================================================================
 #                   Creating Objects in Wwise
 # ==============================================================================
 
+# Casefolded child names per parent id, so create_object(on_conflict="fail") can reject
+# duplicates without a round-trip. Filled from fetch_nodes() listings and _child_names();
+# dropped on creates and change events like the other object memos.
+_CHILD_NAME_CACHE_TTL_S = 1.0
+_child_name_cache: dict[str, tuple[float, set[str]]] = {}
+
+def _child_names_cached(parent_id: str) -> set[str] | None:
+    with _object_cache_lock:
+        entry = _child_name_cache.get(parent_id)
+        if entry is not None and time.monotonic() - entry[0] < _CHILD_NAME_CACHE_TTL_S:
+            return entry[1]
+    return None
+
+def _seed_child_names(nodes: list[dict]) -> None:
+    """Record the child names of every node in a fetch_nodes() subtree (the listing is complete)."""
+    ids_by_key = {_path_key(n["path"]): n["id"] for n in nodes if n.get("path") and n.get("id")}
+    names: dict[str, set[str]] = {gid: set() for gid in ids_by_key.values()}
+    for n in nodes:
+        parent_id = ids_by_key.get(_path_key(n.get("path", "")).rsplit("\\", 1)[0])
+        if parent_id is not None and isinstance(n.get("name"), str):
+            names[parent_id].add(n["name"].casefold())
+    now = time.monotonic()
+    with _object_cache_lock:
+        for gid, child_names in names.items():
+            _child_name_cache[gid] = (now, child_names)
+
+def _child_names(parent_id: str) -> set[str]:
+    names = _child_names_cached(parent_id)
+    if names is not None:
+        return names
+
+    source = {"id": [parent_id]} if parent_id.startswith("{") else {"path": [parent_id]}
+    res = _waapi_read(
+        "ak.wwise.core.object.get",
+        {"from": source, "transform": [{"select": ["children"]}]},
+        {"return": ["name"]},
+    )
+    names = {obj["name"].casefold() for obj in res.get("return", [])}
+    with _object_cache_lock:
+        _child_name_cache[parent_id] = (time.monotonic(), names)
+    return names
+
 def create_object(
     parent_id: str,
     child_name: str,
@@ -1618,6 +2397,13 @@ def create_object(
 
     Returns the GUID (string) of the newly-created object.
     """
+    if on_conflict == "fail":
+        # Only a warm entry is consulted: fetching one first would cost the round-trip
+        # this check saves. Otherwise WAAPI decides.
+        siblings = _child_names_cached(parent_id)
+        if siblings is not None and child_name.casefold() in siblings:
+            raise RuntimeError(f"WAAPI error: an object named '{child_name}' already exists under {parent_id}")
+
     try:  
         res: dict = []
         res = waapi_call(
@@ -1629,11 +2415,69 @@ def create_object(
                  "onNameConflict": on_conflict   # "fail", "rename", "replace", "merge") 
                 }
         )
+        invalidate_object_caches()        # includes this parent's child names
         return res   
     
     except Exception as e:
         raise RuntimeError(f"WAAPI error: {e}")
 
+def create_objects(
+    parent_id: str,
+    specs: list[dict],
+    on_conflict: str = "rename"
+) -> list[dict]:
+    """
+    Creates several children under `parent_id` with one ak.wwise.core.object.set call.
+
+    specs: [{"name": ..., "type": ...}, ...]
+    Returns the created children (id, name, ...) in spec order. Falls back to one
+    create_object() per spec only if Authoring rejects the object.set call.
+    If object.set succeeds but its reply does not list every child, the children
+    are looked up under the parent by name; WwiseApiError if some cannot be found.
+    """
+    if not specs:
+        return []
+
+    children = [{"type": spec["type"], "name": spec["name"]} for spec in specs]
+    try:
+        res = _waapi_read(
+                "ak.wwise.core.object.set",
+                {
+                 "objects": [{"object": parent_id, "children": children}],
+                 "onNameConflict": on_conflict
+                },
+                timeout=_set_timeout(len(children))
+        )
+    except WaapiRequestFailed:
+        # Only a rejection is safe to redo one by one: after a timeout or a dropped
+        # connection the batch may already be applied, and "rename" would duplicate it.
+        logger.debug("object.set create rejected; creating one object at a time", exc_info=True)
+        return [create_object(parent_id, spec["name"], spec["type"], on_conflict) for spec in specs]
+
+    # The children exist from here on: never create them again
+    invalidate_object_caches()
+    objects = (res or {}).get("objects") or []
+    created = objects[0].get("children", []) if objects else []
+    if len(created) == len(specs):
+        return created
+
+    logger.debug("object.set returned %d children for %d specs; looking them up under the parent", len(created), len(specs))
+    source = {"id": [parent_id]} if parent_id.startswith("{") else {"path": [parent_id]}
+    listed = _waapi_read(
+        "ak.wwise.core.object.get",
+        {"from": source, "transform": [{"select": ["children"]}]},
+        {"return": ["id", "name", "type", "path"]},
+    )
+    by_name = {obj["name"]: obj for obj in (listed or {}).get("return", [])}
+    missing = [spec["name"] for spec in specs if spec["name"] not in by_name]
+    if missing:
+        raise WwiseApiError(
+            f"object.set reported {len(created)} of {len(specs)} children and {len(missing)} could not be found by name",
+            operation="ak.wwise.core.object.set",
+            details={"parent": parent_id, "missing_names": missing, "returned_children": created}
+        )
+    return [by_name[spec["name"]] for spec in specs]
+
 # ==============================================================================
 #           Property Names & Valid Ranges for different Wwise Objects
 # ==============================================================================
@@ -1930,8 +2774,36 @@ Metadata list — Metadata
   • List of Metadata objects associated with this Sound.
 """
 
-def get_all_property_name_valid_values() -> str: 
-    return RANDOM_CONTAINER_PROPERTY_HELP + ATTENUATION_PROPERTY_HELP + SOUND_PROPERTY_HELP
+_ALL_PROPERTY_HELP = RANDOM_CONTAINER_PROPERTY_HELP + ATTENUATION_PROPERTY_HELP + SOUND_PROPERTY_HELP
+# Content tag for the help text: clients that send it back get an empty body
+_ALL_PROPERTY_HELP_ETAG = hashlib.sha256(_ALL_PROPERTY_HELP.encode("utf-8")).hexdigest()[:16]
+
+def get_all_property_name_valid_values(client_etag: str | None = None) -> dict: 
+    """
+    Returns {"etag": str, "body": str}. body is empty when client_etag matches,
+    i.e. the caller already holds the current text.
+    """
+    if client_etag == _ALL_PROPERTY_HELP_ETAG:
+        return {"etag": _ALL_PROPERTY_HELP_ETAG, "body": ""}
+    return {"etag": _ALL_PROPERTY_HELP_ETAG, "body": _ALL_PROPERTY_HELP}
+
+_PROPERTY_HELP_BY_KIND = {
+    "randomcontainer": RANDOM_CONTAINER_PROPERTY_HELP,
+    "attenuation":     ATTENUATION_PROPERTY_HELP,
+    "sound":           SOUND_PROPERTY_HELP,
+}
+
+def get_property_help(kind: str) -> str:
+    """Return the property help for one object kind: RandomContainer, Attenuation or Sound."""
+    key = (kind or "").replace(" ", "").replace("_", "").lower()
+    help_text = _PROPERTY_HELP_BY_KIND.get(key)
+    if help_text is None:
+        raise WwiseValidationError(
+            f"Unknown property help kind: {kind!r}. Valid kinds: RandomContainer, Attenuation, Sound",
+            field="kind",
+            value=kind
+        )
+    return help_text
 
 # ==============================================================================
 #                   Additional WAAPI Wrappers (ak.soundengine)
@@ -2099,7 +2971,11 @@ def soundengine_unload_bank(bank_id_or_path: str, **kwargs: Any) -> Any:
 
 def console_project_close() -> Any:
     """Close current project. Uses ak.wwise.console.project.close."""
-    return waapi_call("ak.wwise.console.project.close", {})
+    try:
+        return waapi_call("ak.wwise.console.project.close", {})
+    finally:
+        invalidate_object_caches()
+        invalidate_project_info_cache()
 
 def console_project_create(path: str, platform: str, **kwargs: Any) -> Any:
     """Create new empty project. Uses ak.wwise.console.project.create."""
@@ -2113,7 +2989,12 @@ def console_project_open(path: str, **kwargs: Any) -> Any:
     """Open project by path. Uses ak.wwise.console.project.open."""
     if not path or not str(path).strip():
         raise WwiseValidationError("path cannot be empty")
-    return waapi_call("ak.wwise.console.project.open", {"path": path, **kwargs})
+    try:
+        return waapi_call("ak.wwise.console.project.open", {"path": path, **kwargs})
+    finally:
+        # Every memoized path and name belonged to the previous project
+        invalidate_object_caches()
+        invalidate_project_info_cache()
 
 # ==============================================================================
 #                   ak.wwise.core (getInfo, ping)
@@ -2225,10 +3106,9 @@ def blend_container_add_assignment(
     """Add assignment to a Blend Track. Schema: object, child, edges?, index?."""
     if not blend_container_path or not blend_track_path or not child_path:
         raise WwiseValidationError("blend_container_path, blend_track_path and child_path cannot be empty")
-    obj = get_object_at_path(blend_container_path)
-    track = get_object_at_path(blend_track_path) if blend_track_path.startswith("\\") else {"id": blend_track_path}
-    child = get_object_at_path(child_path) if child_path.startswith("\\") else {"id": child_path}
-    args: dict[str, Any] = {"object": obj["id"], "child": child["id"], **kwargs}
+    ids = _resolve_paths_bulk([blend_container_path, *(p for p in (blend_track_path, child_path) if p.startswith("\\"))])
+    child_id = ids.get(child_path, child_path)
+    args: dict[str, Any] = {"object": ids[blend_container_path], "child": child_id, **kwargs}
     if edges is not None:
         args["edges"] = edges
     if index is not None:
@@ -2246,22 +3126,21 @@ def blend_container_get_assignments(blend_container_path: str, blend_track_path:
     """Get assignments of a Blend Track. Uses ak.wwise.core.blendContainer.getAssignments."""
     if not blend_container_path or not str(blend_container_path).strip():
         raise WwiseValidationError("blend_container_path cannot be empty")
-    obj = get_object_at_path(blend_container_path)
-    args: dict[str, Any] = {"object": obj["id"], **kwargs}
+    track_is_path = bool(blend_track_path) and blend_track_path.startswith("\\")
+    ids = _resolve_paths_bulk([blend_container_path, blend_track_path] if track_is_path else [blend_container_path])
+    args: dict[str, Any] = {"object": ids[blend_container_path], **kwargs}
     if blend_track_path:
-        track = get_object_at_path(blend_track_path) if blend_track_path.startswith("\\") else {"id": blend_track_path}
-        args["blendTrack"] = track["id"]
+        args["blendTrack"] = ids.get(blend_track_path, blend_track_path)
     return waapi_call("ak.wwise.core.blendContainer.getAssignments", args)
 
 def blend_container_remove_assignment(blend_container_path: str, child_path: str, **kwargs: Any) -> Any:
     """Remove assignment from Blend Container. Schema: object, child."""
     if not blend_container_path or not child_path:
         raise WwiseValidationError("blend_container_path and child_path cannot be empty")
-    obj = get_object_at_path(blend_container_path)
-    child = get_object_at_path(child_path) if child_path.startswith("\\") else {"id": child_path}
+    ids = _resolve_paths_bulk([blend_container_path, child_path] if child_path.startswith("\\") else [blend_container_path])
     return waapi_call("ak.wwise.core.blendContainer.removeAssignment", {
-        "object": obj["id"],
-        "child": child["id"],
+        "object": ids[blend_container_path],
+        "child": ids.get(child_path, child_path),
         **kwargs,
     })
 
@@ -2274,11 +3153,10 @@ def switch_container_add_assignment(switch_container_path: str, child_path: str,
     WAAPI expects child and stateOrSwitch only (container inferred from child parent)."""
     if not switch_container_path or not child_path or not state_path:
         raise WwiseValidationError("switch_container_path, child_path and state_path cannot be empty")
-    child = get_object_at_path(child_path)
-    state = get_object_at_path(state_path)
+    ids = _resolve_paths_bulk([child_path, state_path])
     return waapi_call("ak.wwise.core.switchContainer.addAssignment", {
-        "child": child["id"],
-        "stateOrSwitch": state["id"],
+        "child": ids[child_path],
+        "stateOrSwitch": ids[state_path],
     })
 
 def switch_container_get_assignments(switch_container_path: str) -> Any:
@@ -2293,11 +3171,10 @@ def switch_container_remove_assignment(switch_container_path: str, child_path: s
     WAAPI expects child and stateOrSwitch only (container inferred from child parent)."""
     if not switch_container_path or not child_path or not state_path:
         raise WwiseValidationError("switch_container_path, child_path and state_path cannot be empty")
-    child = get_object_at_path(child_path)
-    state = get_object_at_path(state_path)
+    ids = _resolve_paths_bulk([child_path, state_path])
     return waapi_call("ak.wwise.core.switchContainer.removeAssignment", {
-        "child": child["id"],
-        "stateOrSwitch": state["id"],
+        "child": ids[child_path],
+        "stateOrSwitch": ids[state_path],
     })
 
 # ==============================================================================
@@ -2347,24 +3224,26 @@ def object_copy(object_path: str, parent_path: str, **kwargs: Any) -> Any:
     """Copy object to given parent. Uses ak.wwise.core.object.copy."""
     if not object_path or not parent_path:
         raise WwiseValidationError("object_path and parent_path cannot be empty")
-    obj = get_object_at_path(object_path)
-    parent = get_object_at_path(parent_path)
-    return waapi_call("ak.wwise.core.object.copy", {"object": obj["id"], "parent": parent["id"], **kwargs})
+    ids = _resolve_paths_bulk([object_path, parent_path])
+    res = waapi_call("ak.wwise.core.object.copy", {"object": ids[object_path], "parent": ids[parent_path], **kwargs})
+    invalidate_object_caches()
+    return res
 
 def object_delete(object_path: str) -> Any:
     """Delete object. Uses ak.wwise.core.object.delete."""
     if not object_path or not str(object_path).strip():
         raise WwiseValidationError("object_path cannot be empty")
     obj = get_object_at_path(object_path)
-    return waapi_call("ak.wwise.core.object.delete", {"object": obj["id"]})
+    res = waapi_call("ak.wwise.core.object.delete", {"object": obj["id"]})
+    invalidate_object_caches()
+    return res
 
 def object_diff(source_path: str, target_path: str, **kwargs: Any) -> Any:
     """Diff source and target objects. Uses ak.wwise.core.object.diff."""
     if not source_path or not target_path:
         raise WwiseValidationError("source_path and target_path cannot be empty")
-    src = get_object_at_path(source_path)
-    tgt = get_object_at_path(target_path)
-    return waapi_call("ak.wwise.core.object.diff", {"source": src["id"], "target": tgt["id"], **kwargs})
+    ids = _resolve_paths_bulk([source_path, target_path])
+    return waapi_call("ak.wwise.core.object.diff", {"source": ids[source_path], "target": ids[target_path], **kwargs})
 
 def object_get_attenuation_curve(object_path: str, curve_type: str = "Volume", **kwargs: Any) -> Any:
     """Get attenuation curve. Schema: object, curveType."""
@@ -2418,9 +3297,9 @@ def object_paste_properties(source_path: str, target_paths: list[str], **kwargs:
     """Paste properties from source to targets. Schema: source, targets."""
     if not source_path or not target_paths:
         raise WwiseValidationError("source_path and target_paths cannot be empty")
-    src = get_object_at_path(source_path)
-    targets = [get_object_at_path(p)["id"] for p in target_paths]
-    return waapi_call("ak.wwise.core.object.pasteProperties", {"source": src["id"], "targets": targets, **kwargs})
+    ids = _resolve_paths_bulk([source_path, *target_paths])
+    targets = [ids[p] for p in target_paths]
+    return waapi_call("ak.wwise.core.object.pasteProperties", {"source": ids[source_path], "targets": targets, **kwargs})
 
 def object_set(object_path: str, updates: dict[str, Any], **kwargs: Any) -> Any:
     """Batch set properties/references on object. Schema: objects (array of object ids)."""
@@ -2497,9 +3376,9 @@ def object_set_state_groups(object_path: str, state_groups: list[str]) -> Any:
     """Set State Groups associated with object. Uses ak.wwise.core.object.setStateGroups."""
     if not object_path:
         raise WwiseValidationError("object_path cannot be empty")
-    obj = get_object_at_path(object_path)
-    ids = [get_object_at_path(p)["id"] for p in state_groups] if state_groups else []
-    return waapi_call("ak.wwise.core.object.setStateGroups", {"object": obj["id"], "stateGroups": ids})
+    ids = _resolve_paths_bulk([object_path, *(state_groups or [])])
+    group_ids = [ids[p] for p in state_groups] if state_groups else []
+    return waapi_call("ak.wwise.core.object.setStateGroups", {"object": ids[object_path], "stateGroups": group_ids})
 
 def object_set_state_properties(object_path: str, state_properties: list[dict], **kwargs: Any) -> Any:
     """Set state properties of object. Uses ak.wwise.core.object.setStateProperties."""
@@ -2646,9 +3525,10 @@ def sound_set_active_source(sound_path: str, source_id_or_path: str, **kwargs: A
     """Set active source for Sound. Schema: sound, source, platform?."""
     if not sound_path or not source_id_or_path:
         raise WwiseValidationError("sound_path and source_id_or_path cannot be empty")
-    sound_obj = get_object_at_path(sound_path)
-    src_id = get_object_at_path(source_id_or_path)["id"] if isinstance(source_id_or_path, str) and source_id_or_path.startswith("\\") else source_id_or_path
-    return waapi_call("ak.wwise.core.sound.setActiveSource", {"sound": sound_obj["id"], "source": src_id, **kwargs})
+    source_is_path = isinstance(source_id_or_path, str) and source_id_or_path.startswith("\\")
+    ids = _resolve_paths_bulk([sound_path, source_id_or_path] if source_is_path else [sound_path])
+    src_id = ids[source_id_or_path] if source_is_path else source_id_or_path
+    return waapi_call("ak.wwise.core.sound.setActiveSource", {"sound": ids[sound_path], "source": src_id, **kwargs})
 
 # ==============================================================================
 #                   ak.wwise.core.soundbank (remaining)
@@ -3096,206 +3976,94 @@ def waapi_subscription_events(subscription_id: str, max_count: int | None = None
 
 # WAAPI topic URIs from Wwise Authoring API Reference (Topics index).
 # Use waapi_subscribe(uri) to subscribe; use these constants for discovery.
-WAAPI_TOPICS = [
-    "ak.wwise.core.audio.imported",
-    "ak.wwise.core.log.itemAdded",
-    "ak.wwise.core.object.attenuationCurveChanged",
-    "ak.wwise.core.object.attenuationCurveLinkChanged",
-    "ak.wwise.core.object.childAdded",
-    "ak.wwise.core.object.childRemoved",
-    "ak.wwise.core.object.created",
-    "ak.wwise.core.object.curveChanged",
-    "ak.wwise.core.object.nameChanged",
-    "ak.wwise.core.object.notesChanged",
-    "ak.wwise.core.object.postDeleted",
-    "ak.wwise.core.object.preDeleted",
-    "ak.wwise.core.object.propertyChanged",
-    "ak.wwise.core.object.referenceChanged",
-    "ak.wwise.core.object.structureChanged",
-    "ak.wwise.core.profiler.captureLog.itemAdded",
-    "ak.wwise.core.profiler.gameObjectRegistered",
-    "ak.wwise.core.profiler.gameObjectReset",
-    "ak.wwise.core.profiler.gameObjectUnregistered",
-    "ak.wwise.core.profiler.stateChanged",
-    "ak.wwise.core.profiler.switchChanged",
-    "ak.wwise.core.project.loaded",
-    "ak.wwise.core.project.postClosed",
-    "ak.wwise.core.project.preClosed",
-    "ak.wwise.core.project.saved",
-    "ak.wwise.core.soundbank.generated",
-    "ak.wwise.core.soundbank.generationDone",
-    "ak.wwise.core.switchContainer.assignmentAdded",
-    "ak.wwise.core.switchContainer.assignmentRemoved",
-    "ak.wwise.core.transport.stateChanged",
-    "ak.wwise.debug.assertFailed",
-    "ak.wwise.ui.commands.executed",
-    "ak.wwise.ui.selectionChanged",
-]
-
-
-def subscribe_topic_audio_imported(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.audio.imported (import operation ended)."""
-    return waapi_subscribe("ak.wwise.core.audio.imported", **kwargs)
-
-
-def subscribe_topic_log_item_added(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.log.itemAdded (log entry added)."""
-    return waapi_subscribe("ak.wwise.core.log.itemAdded", **kwargs)
-
-
-def subscribe_topic_object_attenuation_curve_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.attenuationCurveChanged."""
-    return waapi_subscribe("ak.wwise.core.object.attenuationCurveChanged", **kwargs)
-
-
-def subscribe_topic_object_attenuation_curve_link_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.attenuationCurveLinkChanged."""
-    return waapi_subscribe("ak.wwise.core.object.attenuationCurveLinkChanged", **kwargs)
-
-
-def subscribe_topic_object_child_added(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.childAdded."""
-    return waapi_subscribe("ak.wwise.core.object.childAdded", **kwargs)
-
-
-def subscribe_topic_object_child_removed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.childRemoved."""
-    return waapi_subscribe("ak.wwise.core.object.childRemoved", **kwargs)
-
-
-def subscribe_topic_object_created(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.created."""
-    return waapi_subscribe("ak.wwise.core.object.created", **kwargs)
-
-
-def subscribe_topic_object_curve_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.curveChanged."""
-    return waapi_subscribe("ak.wwise.core.object.curveChanged", **kwargs)
-
-
-def subscribe_topic_object_name_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.nameChanged."""
-    return waapi_subscribe("ak.wwise.core.object.nameChanged", **kwargs)
-
-
-def subscribe_topic_object_notes_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.notesChanged."""
-    return waapi_subscribe("ak.wwise.core.object.notesChanged", **kwargs)
-
-
-def subscribe_topic_object_post_deleted(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.postDeleted."""
-    return waapi_subscribe("ak.wwise.core.object.postDeleted", **kwargs)
-
-
-def subscribe_topic_object_pre_deleted(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.preDeleted."""
-    return waapi_subscribe("ak.wwise.core.object.preDeleted", **kwargs)
-
-
-def subscribe_topic_object_property_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.propertyChanged."""
-    return waapi_subscribe("ak.wwise.core.object.propertyChanged", **kwargs)
-
-
-def subscribe_topic_object_reference_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.referenceChanged."""
-    return waapi_subscribe("ak.wwise.core.object.referenceChanged", **kwargs)
-
-
-def subscribe_topic_object_structure_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.object.structureChanged."""
-    return waapi_subscribe("ak.wwise.core.object.structureChanged", **kwargs)
-
-
-def subscribe_topic_profiler_capture_log_item_added(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.profiler.captureLog.itemAdded."""
-    return waapi_subscribe("ak.wwise.core.profiler.captureLog.itemAdded", **kwargs)
-
-
-def subscribe_topic_profiler_game_object_registered(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.profiler.gameObjectRegistered."""
-    return waapi_subscribe("ak.wwise.core.profiler.gameObjectRegistered", **kwargs)
-
-
-def subscribe_topic_profiler_game_object_reset(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.profiler.gameObjectReset."""
-    return waapi_subscribe("ak.wwise.core.profiler.gameObjectReset", **kwargs)
-
-
-def subscribe_topic_profiler_game_object_unregistered(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.profiler.gameObjectUnregistered."""
-    return waapi_subscribe("ak.wwise.core.profiler.gameObjectUnregistered", **kwargs)
-
-
-def subscribe_topic_profiler_state_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.profiler.stateChanged."""
-    return waapi_subscribe("ak.wwise.core.profiler.stateChanged", **kwargs)
-
-
-def subscribe_topic_profiler_switch_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.profiler.switchChanged."""
-    return waapi_subscribe("ak.wwise.core.profiler.switchChanged", **kwargs)
-
-
-def subscribe_topic_project_loaded(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.project.loaded."""
-    return waapi_subscribe("ak.wwise.core.project.loaded", **kwargs)
-
-
-def subscribe_topic_project_post_closed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.project.postClosed."""
-    return waapi_subscribe("ak.wwise.core.project.postClosed", **kwargs)
-
-
-def subscribe_topic_project_pre_closed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.project.preClosed."""
-    return waapi_subscribe("ak.wwise.core.project.preClosed", **kwargs)
-
-
-def subscribe_topic_project_saved(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.project.saved."""
-    return waapi_subscribe("ak.wwise.core.project.saved", **kwargs)
-
-
-def subscribe_topic_soundbank_generated(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.soundbank.generated."""
-    return waapi_subscribe("ak.wwise.core.soundbank.generated", **kwargs)
-
-
-def subscribe_topic_soundbank_generation_done(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.soundbank.generationDone."""
-    return waapi_subscribe("ak.wwise.core.soundbank.generationDone", **kwargs)
-
-
-def subscribe_topic_switch_container_assignment_added(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.switchContainer.assignmentAdded."""
-    return waapi_subscribe("ak.wwise.core.switchContainer.assignmentAdded", **kwargs)
-
-
-def subscribe_topic_switch_container_assignment_removed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.switchContainer.assignmentRemoved."""
-    return waapi_subscribe("ak.wwise.core.switchContainer.assignmentRemoved", **kwargs)
-
-
-def subscribe_topic_transport_state_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.core.transport.stateChanged."""
-    return waapi_subscribe("ak.wwise.core.transport.stateChanged", **kwargs)
-
-
-def subscribe_topic_debug_assert_failed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.debug.assertFailed (Debug builds only)."""
-    return waapi_subscribe("ak.wwise.debug.assertFailed", **kwargs)
-
+WAAPI_TOPIC_URIS: dict[str, str] = {
+    "audio_imported": "ak.wwise.core.audio.imported",
+    "log_item_added": "ak.wwise.core.log.itemAdded",
+    "object_attenuation_curve_changed": "ak.wwise.core.object.attenuationCurveChanged",
+    "object_attenuation_curve_link_changed": "ak.wwise.core.object.attenuationCurveLinkChanged",
+    "object_child_added": "ak.wwise.core.object.childAdded",
+    "object_child_removed": "ak.wwise.core.object.childRemoved",
+    "object_created": "ak.wwise.core.object.created",
+    "object_curve_changed": "ak.wwise.core.object.curveChanged",
+    "object_name_changed": "ak.wwise.core.object.nameChanged",
+    "object_notes_changed": "ak.wwise.core.object.notesChanged",
+    "object_post_deleted": "ak.wwise.core.object.postDeleted",
+    "object_pre_deleted": "ak.wwise.core.object.preDeleted",
+    "object_property_changed": "ak.wwise.core.object.propertyChanged",
+    "object_reference_changed": "ak.wwise.core.object.referenceChanged",
+    "object_structure_changed": "ak.wwise.core.object.structureChanged",
+    "profiler_capture_log_item_added": "ak.wwise.core.profiler.captureLog.itemAdded",
+    "profiler_game_object_registered": "ak.wwise.core.profiler.gameObjectRegistered",
+    "profiler_game_object_reset": "ak.wwise.core.profiler.gameObjectReset",
+    "profiler_game_object_unregistered": "ak.wwise.core.profiler.gameObjectUnregistered",
+    "profiler_state_changed": "ak.wwise.core.profiler.stateChanged",
+    "profiler_switch_changed": "ak.wwise.core.profiler.switchChanged",
+    "project_loaded": "ak.wwise.core.project.loaded",
+    "project_post_closed": "ak.wwise.core.project.postClosed",
+    "project_pre_closed": "ak.wwise.core.project.preClosed",
+    "project_saved": "ak.wwise.core.project.saved",
+    "soundbank_generated": "ak.wwise.core.soundbank.generated",
+    "soundbank_generation_done": "ak.wwise.core.soundbank.generationDone",
+    "switch_container_assignment_added": "ak.wwise.core.switchContainer.assignmentAdded",
+    "switch_container_assignment_removed": "ak.wwise.core.switchContainer.assignmentRemoved",
+    "transport_state_changed": "ak.wwise.core.transport.stateChanged",
+    "debug_assert_failed": "ak.wwise.debug.assertFailed",
+    "ui_commands_executed": "ak.wwise.ui.commands.executed",
+    "ui_selection_changed": "ak.wwise.ui.selectionChanged",
+}
 
-def subscribe_topic_ui_commands_executed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.ui.commands.executed."""
-    return waapi_subscribe("ak.wwise.ui.commands.executed", **kwargs)
+WAAPI_TOPICS = list(WAAPI_TOPIC_URIS.values())
 
+# Extra detail for a topic's subscribe_topic_* docstring.
+_TOPIC_NOTES: dict[str, str] = {
+    "audio_imported": "import operation ended",
+    "log_item_added": "log entry added",
+    "debug_assert_failed": "Debug builds only",
+}
 
-def subscribe_topic_ui_selection_changed(**kwargs: Any) -> str:
-    """Subscribe to ak.wwise.ui.selectionChanged."""
-    return waapi_subscribe("ak.wwise.ui.selectionChanged", **kwargs)
+def _topic_subscriber(topic_name: str):
+    """subscribe_topic_<topic_name>(options=None, **kwargs): waapi_subscribe() bound to the topic's URI."""
+    uri = WAAPI_TOPIC_URIS[topic_name]
+    def subscribe(options: dict | None = None, **kwargs: Any) -> str:
+        return waapi_subscribe(uri, options, **kwargs)
+    note = _TOPIC_NOTES.get(topic_name)
+    subscribe.__name__ = subscribe.__qualname__ = f"subscribe_topic_{topic_name}"
+    subscribe.__doc__ = f"Subscribe to {uri} ({note})." if note else f"Subscribe to {uri}."
+    return subscribe
+
+subscribe_topic_audio_imported = _topic_subscriber("audio_imported")
+subscribe_topic_log_item_added = _topic_subscriber("log_item_added")
+subscribe_topic_object_attenuation_curve_changed = _topic_subscriber("object_attenuation_curve_changed")
+subscribe_topic_object_attenuation_curve_link_changed = _topic_subscriber("object_attenuation_curve_link_changed")
+subscribe_topic_object_child_added = _topic_subscriber("object_child_added")
+subscribe_topic_object_child_removed = _topic_subscriber("object_child_removed")
+subscribe_topic_object_created = _topic_subscriber("object_created")
+subscribe_topic_object_curve_changed = _topic_subscriber("object_curve_changed")
+subscribe_topic_object_name_changed = _topic_subscriber("object_name_changed")
+subscribe_topic_object_notes_changed = _topic_subscriber("object_notes_changed")
+subscribe_topic_object_post_deleted = _topic_subscriber("object_post_deleted")
+subscribe_topic_object_pre_deleted = _topic_subscriber("object_pre_deleted")
+subscribe_topic_object_property_changed = _topic_subscriber("object_property_changed")
+subscribe_topic_object_reference_changed = _topic_subscriber("object_reference_changed")
+subscribe_topic_object_structure_changed = _topic_subscriber("object_structure_changed")
+subscribe_topic_profiler_capture_log_item_added = _topic_subscriber("profiler_capture_log_item_added")
+subscribe_topic_profiler_game_object_registered = _topic_subscriber("profiler_game_object_registered")
+subscribe_topic_profiler_game_object_reset = _topic_subscriber("profiler_game_object_reset")
+subscribe_topic_profiler_game_object_unregistered = _topic_subscriber("profiler_game_object_unregistered")
+subscribe_topic_profiler_state_changed = _topic_subscriber("profiler_state_changed")
+subscribe_topic_profiler_switch_changed = _topic_subscriber("profiler_switch_changed")
+subscribe_topic_project_loaded = _topic_subscriber("project_loaded")
+subscribe_topic_project_post_closed = _topic_subscriber("project_post_closed")
+subscribe_topic_project_pre_closed = _topic_subscriber("project_pre_closed")
+subscribe_topic_project_saved = _topic_subscriber("project_saved")
+subscribe_topic_soundbank_generated = _topic_subscriber("soundbank_generated")
+subscribe_topic_soundbank_generation_done = _topic_subscriber("soundbank_generation_done")
+subscribe_topic_switch_container_assignment_added = _topic_subscriber("switch_container_assignment_added")
+subscribe_topic_switch_container_assignment_removed = _topic_subscriber("switch_container_assignment_removed")
+subscribe_topic_transport_state_changed = _topic_subscriber("transport_state_changed")
+subscribe_topic_debug_assert_failed = _topic_subscriber("debug_assert_failed")
+subscribe_topic_ui_commands_executed = _topic_subscriber("ui_commands_executed")
+subscribe_topic_ui_selection_changed = _topic_subscriber("ui_selection_changed")
 
 
 def waapi_list_topic_uris() -> list[str]:
@@ -3303,19 +4071,181 @@ def waapi_list_topic_uris() -> list[str]:
     return list(WAAPI_TOPICS)
 
 
+def _make_async(func):
+    """Awaitable twin of a sync wrapper: runs it in a worker thread, like aget_project_info()."""
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    wrapper.__name__ = wrapper.__qualname__ = f"a{func.__name__}"
+    return wrapper
+
+# a<wrapper> twins of the WAAPI wrappers above, named like aget_project_info(), e.g.
+#     await asyncio.gather(*(aobject_delete(p) for p in paths))
+# The event loop is never blocked on a reply and the calls are queued on the
+# dispatcher together, but the dispatcher still runs them one after another.
+asoundengine_get_state = _make_async(soundengine_get_state)
+asoundengine_get_switch = _make_async(soundengine_get_switch)
+asoundengine_load_bank = _make_async(soundengine_load_bank)
+asoundengine_post_msg_monitor = _make_async(soundengine_post_msg_monitor)
+asoundengine_post_trigger = _make_async(soundengine_post_trigger)
+asoundengine_reset_rtpc_value = _make_async(soundengine_reset_rtpc_value)
+asoundengine_seek_on_event = _make_async(soundengine_seek_on_event)
+asoundengine_set_game_object_aux_send_values = _make_async(soundengine_set_game_object_aux_send_values)
+asoundengine_set_game_object_output_bus_volume = _make_async(soundengine_set_game_object_output_bus_volume)
+asoundengine_set_listener_spatialization = _make_async(soundengine_set_listener_spatialization)
+asoundengine_set_multiple_positions = _make_async(soundengine_set_multiple_positions)
+asoundengine_set_object_obstruction_and_occlusion = _make_async(soundengine_set_object_obstruction_and_occlusion)
+asoundengine_set_scaling_factor = _make_async(soundengine_set_scaling_factor)
+asoundengine_stop_playing_id = _make_async(soundengine_stop_playing_id)
+asoundengine_unload_bank = _make_async(soundengine_unload_bank)
+aconsole_project_close = _make_async(console_project_close)
+aconsole_project_create = _make_async(console_project_create)
+aconsole_project_open = _make_async(console_project_open)
+aget_info = _make_async(get_info)
+acore_ping = _make_async(core_ping)
+aaudio_convert = _make_async(audio_convert)
+aaudio_import_tab_delimited = _make_async(audio_import_tab_delimited)
+aaudio_mute = _make_async(audio_mute)
+aaudio_reset_mute = _make_async(audio_reset_mute)
+aaudio_reset_solo = _make_async(audio_reset_solo)
+aaudio_set_conversion_plugin = _make_async(audio_set_conversion_plugin)
+aaudio_solo = _make_async(audio_solo)
+aaudio_source_peaks_get_min_max_peaks_in_region = _make_async(audio_source_peaks_get_min_max_peaks_in_region)
+aaudio_source_peaks_get_min_max_peaks_in_trimmed_region = _make_async(audio_source_peaks_get_min_max_peaks_in_trimmed_region)
+ablend_container_add_assignment = _make_async(blend_container_add_assignment)
+ablend_container_add_track = _make_async(blend_container_add_track)
+ablend_container_get_assignments = _make_async(blend_container_get_assignments)
+ablend_container_remove_assignment = _make_async(blend_container_remove_assignment)
+aswitch_container_add_assignment = _make_async(switch_container_add_assignment)
+aswitch_container_get_assignments = _make_async(switch_container_get_assignments)
+aswitch_container_remove_assignment = _make_async(switch_container_remove_assignment)
+aexecute_lua_script = _make_async(execute_lua_script)
+alog_add_item = _make_async(log_add_item)
+alog_clear = _make_async(log_clear)
+alog_get = _make_async(log_get)
+amedia_pool_get = _make_async(media_pool_get)
+amedia_pool_get_fields = _make_async(media_pool_get_fields)
+aobject_copy = _make_async(object_copy)
+aobject_delete = _make_async(object_delete)
+aobject_diff = _make_async(object_diff)
+aobject_get_attenuation_curve = _make_async(object_get_attenuation_curve)
+aobject_get_property_and_reference_names = _make_async(object_get_property_and_reference_names)
+aobject_get_property_info = _make_async(object_get_property_info)
+aobject_get_property_names = _make_async(object_get_property_names)
+aobject_get_types = _make_async(object_get_types)
+aobject_is_linked = _make_async(object_is_linked)
+aobject_is_property_enabled = _make_async(object_is_property_enabled)
+aobject_paste_properties = _make_async(object_paste_properties)
+aobject_set = _make_async(object_set)
+aobject_set_attenuation_curve = _make_async(object_set_attenuation_curve)
+aobject_set_linked = _make_async(object_set_linked)
+aobject_set_notes = _make_async(object_set_notes)
+aobject_set_randomizer = _make_async(object_set_randomizer)
+aobject_set_state_groups = _make_async(object_set_state_groups)
+aobject_set_state_properties = _make_async(object_set_state_properties)
+aplugin_get_list = _make_async(plugin_get_list)
+aplugin_get_properties = _make_async(plugin_get_properties)
+aplugin_get_property = _make_async(plugin_get_property)
+aprofiler_enable_profiler_data = _make_async(profiler_enable_profiler_data)
+aprofiler_get_audio_objects = _make_async(profiler_get_audio_objects)
+aprofiler_get_busses = _make_async(profiler_get_busses)
+aprofiler_get_cpu_usage = _make_async(profiler_get_cpu_usage)
+aprofiler_get_cursor_time = _make_async(profiler_get_cursor_time)
+aprofiler_get_loaded_media = _make_async(profiler_get_loaded_media)
+aprofiler_get_meters = _make_async(profiler_get_meters)
+aprofiler_get_performance_monitor = _make_async(profiler_get_performance_monitor)
+aprofiler_get_rtpcs = _make_async(profiler_get_rtpcs)
+aprofiler_get_streamed_media = _make_async(profiler_get_streamed_media)
+aprofiler_get_voice_contributions = _make_async(profiler_get_voice_contributions)
+aprofiler_get_voices = _make_async(profiler_get_voices)
+aprofiler_register_meter = _make_async(profiler_register_meter)
+aprofiler_save_capture = _make_async(profiler_save_capture)
+aprofiler_start_capture = _make_async(profiler_start_capture)
+aprofiler_stop_capture = _make_async(profiler_stop_capture)
+aprofiler_unregister_meter = _make_async(profiler_unregister_meter)
+aproject_save = _make_async(project_save)
+aremote_connect = _make_async(remote_connect)
+aremote_disconnect = _make_async(remote_disconnect)
+aremote_get_available_consoles = _make_async(remote_get_available_consoles)
+aremote_get_connection_status = _make_async(remote_get_connection_status)
+asound_set_active_source = _make_async(sound_set_active_source)
+asoundbank_get_inclusions = _make_async(soundbank_get_inclusions)
+asoundbank_process_definition_files = _make_async(soundbank_process_definition_files)
+asoundbank_convert_external_sources = _make_async(soundbank_convert_external_sources)
+asource_control_add = _make_async(source_control_add)
+asource_control_check_out = _make_async(source_control_check_out)
+asource_control_commit = _make_async(source_control_commit)
+asource_control_delete = _make_async(source_control_delete)
+asource_control_get_source_files = _make_async(source_control_get_source_files)
+asource_control_get_status = _make_async(source_control_get_status)
+asource_control_move = _make_async(source_control_move)
+asource_control_revert = _make_async(source_control_revert)
+asource_control_set_provider = _make_async(source_control_set_provider)
+atransport_create = _make_async(transport_create)
+atransport_destroy = _make_async(transport_destroy)
+atransport_execute_action = _make_async(transport_execute_action)
+atransport_get_list = _make_async(transport_get_list)
+atransport_get_state = _make_async(transport_get_state)
+atransport_prepare = _make_async(transport_prepare)
+aundo_begin_group = _make_async(undo_begin_group)
+aundo_cancel_group = _make_async(undo_cancel_group)
+aundo_end_group = _make_async(undo_end_group)
+aundo_redo = _make_async(undo_redo)
+aundo_undo = _make_async(undo_undo)
+awork_unit_load = _make_async(work_unit_load)
+awork_unit_unload = _make_async(work_unit_unload)
+adebug_enable_asserts = _make_async(debug_enable_asserts)
+adebug_enable_automation_mode = _make_async(debug_enable_automation_mode)
+adebug_generate_tone_wav = _make_async(debug_generate_tone_wav)
+adebug_get_wal_tree = _make_async(debug_get_wal_tree)
+adebug_restart_waapi_servers = _make_async(debug_restart_waapi_servers)
+adebug_test_assert = _make_async(debug_test_assert)
+adebug_test_crash = _make_async(debug_test_crash)
+adebug_validate_call = _make_async(debug_validate_call)
+aui_bring_to_foreground = _make_async(ui_bring_to_foreground)
+aui_capture_screen = _make_async(ui_capture_screen)
+aui_commands_execute = _make_async(ui_commands_execute)
+aui_commands_get_commands = _make_async(ui_commands_get_commands)
+aui_commands_register = _make_async(ui_commands_register)
+aui_commands_unregister = _make_async(ui_commands_unregister)
+aui_get_selected_files = _make_async(ui_get_selected_files)
+aui_layout_close_view = _make_async(ui_layout_close_view)
+aui_layout_dock_view = _make_async(ui_layout_dock_view)
+aui_layout_get_current_layout_name = _make_async(ui_layout_get_current_layout_name)
+aui_layout_get_element_rectangle = _make_async(ui_layout_get_element_rectangle)
+aui_layout_get_layout = _make_async(ui_layout_get_layout)
+aui_layout_get_layout_names = _make_async(ui_layout_get_layout_names)
+aui_layout_get_or_create_view = _make_async(ui_layout_get_or_create_view)
+aui_layout_get_view_instances = _make_async(ui_layout_get_view_instances)
+aui_layout_get_view_types = _make_async(ui_layout_get_view_types)
+aui_layout_move_splitter = _make_async(ui_layout_move_splitter)
+aui_layout_remove_layout = _make_async(ui_layout_remove_layout)
+aui_layout_reset_layouts = _make_async(ui_layout_reset_layouts)
+aui_layout_set_layout = _make_async(ui_layout_set_layout)
+aui_layout_undock_view = _make_async(ui_layout_undock_view)
+aui_project_close = _make_async(ui_project_close)
+aui_project_create = _make_async(ui_project_create)
+aui_project_open = _make_async(ui_project_open)
+awaapi_get_functions = _make_async(waapi_get_functions)
+awaapi_get_schema = _make_async(waapi_get_schema)
+awaapi_get_topics = _make_async(waapi_get_topics)
+
+
 # ==============================================================================
 #                   Editor Layouts in Wwise
 # ==============================================================================
 
-LAYOUTS = ["Designer", "Profiler", "Soundbank", "Mixer", "Audio Object Profiler", "Voice Profiler", "Game Object Profiler"]
+# Ordered for display; membership goes through the frozenset
+LAYOUTS = ("Designer", "Profiler", "Soundbank", "Mixer", "Audio Object Profiler", "Voice Profiler", "Game Object Profiler")
+_LAYOUT_SET = frozenset(LAYOUTS)
 
 def toggle_layout(request_layout : str)->dict:
     
-    if request_layout not in LAYOUTS:
+    if request_layout not in _LAYOUT_SET:
         logger.exception("No such layout exists : %r", request_layout)
         
         raise ValueError("toggle_layout can only one of accept these args : " \
-        "Designer, Profiler, Soundbank, Mixer, Audio Object Profiler, Voice Profiler, Game Object Profiler. " \
+        f"{', '.join(LAYOUTS)}. " \
         "They are case sensitive.")
     
     return waapi_call("ak.wwise.ui.layout.switchLayout", {"name": request_layout})
\ No newline at end of file
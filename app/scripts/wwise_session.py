@@ -10,7 +10,7 @@ Not suitable for:
 
 """
 
-from waapi import WaapiClient
+from waapi import WaapiClient, WaapiRequestFailed
 from waapi.client.event import EventHandler
 import threading
 import time
@@ -18,6 +18,9 @@ import heapq
 import queue
 import logging
 import uuid
+import itertools
+import atexit
+from collections import deque
 from typing import TypedDict, Optional, Any
 
 
@@ -30,12 +33,16 @@ _DEFAULT_TIMEOUT = 1.0
 _DISPATCHER_SHUTDOWN_TIMEOUT = 2.0
 _QUEUE_CHECK_INTERVAL = 0.1
 _MAX_QUEUE_SIZE = 100000
+_RECONNECT_ATTEMPTS = 3
+_RECONNECT_BASE_DELAY = 0.1
 
 # Module-level state
 _client = None
 _dispatcher = None
 _lock = threading.Lock()
 _reconnecting = False 
+_generation = 0                 # bumped on every successful (re)connect
+_batch_tls = threading.local()
 
 
 class WaapiError(Exception):
@@ -55,19 +62,32 @@ def waapi_call(
     *,
     due_in: float | None = None,     # seconds from now (None = ASAP) 
     wait: bool = True,               # wait for result or fire-and-forget
-    timeout: float = _DEFAULT_TIMEOUT):
+    timeout: float = _DEFAULT_TIMEOUT,
+    idempotent: bool | None = None,  # None = only read URIs (get*/list*/is*/ping)
+    _retry: bool = True,
+    _batchable: bool = True):
 
     """
     Thread-safe WAAPI call.
     - If on dispatcher thread -> call client directly.
     - Else -> enqueue on dispatcher; optionally wait for result.
     - Can schedule for the future with due_in / due_at.
+    - If the call fails because the WebSocket dropped, reconnects (with backoff)
+      and, for reads or calls marked idempotent=True, retries it once right away.
+      Mutations are not re-sent: like a timed-out call, they may already have run.
+    - _batchable=False runs the call even inside a WaapiBatch; for internal reads
+      whose reply is needed immediately (cache fills, path lookups).
     """
 
     if due_in is not None and due_in < 0.0: 
         logger.error("Invalid due_in value: %s (must be >= 0.0)", due_in)
         raise ValueError("due_in value cannot be negative. Please pass in >= 0.0 value ranges for due_in.")
 
+    # Inside a WaapiBatch on this thread: defer the call until the batch flushes
+    batch = getattr(_batch_tls, "batch", None) if _batchable else None
+    if batch is not None:
+        return batch._add(uri, args or {}, options, due_in, wait)
+
     global _client, _dispatcher, _reconnecting
 
     # Capture references under lock
@@ -124,10 +144,280 @@ def waapi_call(
         logger.debug("WAAPI call succeeded. URI: %s", uri)
         return data
     
+    if _retry and _connection_dropped():
+        if idempotent if idempotent is not None else _is_read_uri(uri):
+            logger.warning("WAAPI connection dropped during call. URI: %s; reconnecting and retrying once", uri)
+            if _reconnect_with_backoff():
+                # The original delay has already elapsed
+                return waapi_call(uri, args, options, due_in=0.0, wait=wait, timeout=timeout,
+                                  idempotent=idempotent, _retry=False, _batchable=False)
+        else:
+            logger.warning("WAAPI connection dropped during call. URI: %s; reconnecting, not retrying (may have run)", uri)
+            _reconnect_with_backoff()
+
     logger.error("WAAPI call failed. URI: %s, Error: %s", uri, str(data))
     raise data
 
 
+_READ_METHOD_PREFIXES = ("get", "list", "is", "ping")
+
+def _is_read_uri(uri: str) -> bool:
+    """True for read-only WAAPI methods (ak.wwise.core.object.get, ...getProjectInfo, ...)."""
+    return uri.rsplit(".", 1)[-1].startswith(_READ_METHOD_PREFIXES)
+
+def _connection_dropped() -> bool:
+    with _lock:
+        client = _client
+        reconnecting = _reconnecting
+    if reconnecting or client is None:
+        return False
+    try:
+        return not client.is_connected()
+    except Exception:
+        return True
+
+def _reconnect_with_backoff() -> bool:
+    """Try ensure_connected() up to _RECONNECT_ATTEMPTS times with exponential backoff."""
+    delay = _RECONNECT_BASE_DELAY
+    for attempt in range(1, _RECONNECT_ATTEMPTS + 1):
+        try:
+            ensure_connected()
+            return True
+        except Exception as e:
+            logger.warning("WAAPI reconnect attempt %d/%d failed: %s", attempt, _RECONNECT_ATTEMPTS, str(e))
+            if attempt < _RECONNECT_ATTEMPTS:
+                time.sleep(delay)
+                delay *= 2
+    return False
+
+
+def waapi_call_batch(
+    calls: list[tuple[str, dict, float | None]],
+    options: dict | None = None):
+
+    """
+    Thread-safe fire-and-forget enqueue of many WAAPI calls at once.
+    - Each entry is (uri, args, due_in); due_in keeps its waapi_call meaning.
+    - All entries are pushed under a single queue lock and wake-up.
+    WAAPI has no batch RPC, so the dispatcher still sends one call per entry.
+    """
+
+    for _, _, due_in in calls:
+        if due_in is not None and due_in < 0.0:
+            logger.error("Invalid due_in value: %s (must be >= 0.0)", due_in)
+            raise ValueError("due_in value cannot be negative. Please pass in >= 0.0 value ranges for due_in.")
+
+    global _client, _dispatcher, _reconnecting
+
+    with _lock:
+        if _reconnecting:
+            raise ValueError(
+                "WAAPI is reconnecting. Please retry in a moment."
+            )
+        
+        if _client is None or _dispatcher is None:
+            logger.error("WAAPI batch attempted before connection established (%d calls)", len(calls))
+            raise ValueError("WAAPI not connected. Call connect_to_waapi() first.")
+                
+        dispatcher = _dispatcher
+
+        if not dispatcher.is_alive():
+            logger.error("WAAPI dispatcher thread is not running (%d calls)", len(calls))
+            raise ValueError("WAAPI dispatcher not running. Call connect_to_waapi() to restart.")
+
+    now = time.monotonic()
+    dispatcher.enqueue_many(
+        [(uri, args, options, (now + due_in) if due_in else None) for uri, args, due_in in calls]
+    )
+    logger.debug("Fire-and-forget batch enqueued (%d calls)", len(calls))
+
+
+def waapi_call_many(
+    calls: list[tuple],
+    *,
+    timeout: float = _DEFAULT_TIMEOUT,
+    return_exceptions: bool = False) -> list:
+
+    """
+    Thread-safe pipelined WAAPI calls that each need a reply.
+    - Each entry is (uri, args, options) or (uri, args, options, due_in).
+    - All entries are enqueued at once; the dispatcher runs them back-to-back in order,
+      so the caller waits once for the batch instead of once per call.
+    - Every call is attempted even if an earlier one fails. With return_exceptions the
+      failures are returned in place (as asyncio.gather does); otherwise the first is raised.
+    - timeout applies to each reply.
+    """
+
+    if not calls:
+        return []
+
+    for call in calls:
+        due_in = call[3] if len(call) > 3 else None
+        if due_in is not None and due_in < 0.0:
+            logger.error("Invalid due_in value: %s (must be >= 0.0)", due_in)
+            raise ValueError("due_in value cannot be negative. Please pass in >= 0.0 value ranges for due_in.")
+
+    global _client, _dispatcher, _reconnecting
+
+    with _lock:
+        if _reconnecting:
+            raise ValueError(
+                "WAAPI is reconnecting. Please retry in a moment."
+            )
+        
+        if _client is None or _dispatcher is None:
+            logger.error("WAAPI call_many attempted before connection established (%d calls)", len(calls))
+            raise ValueError("WAAPI not connected. Call connect_to_waapi() first.")
+                
+        dispatcher = _dispatcher
+
+        if not dispatcher.is_alive():
+            logger.error("WAAPI dispatcher thread is not running (%d calls)", len(calls))
+            raise ValueError("WAAPI dispatcher not running. Call connect_to_waapi() to restart.")
+
+        is_dispatcher_thread = dispatcher.is_dispatcher_thread()
+
+    if is_dispatcher_thread:
+        logger.error("waapi_call_many() invoked from dispatcher thread (%d calls)", len(calls))
+        raise RuntimeError("Cannot call waapi_call_many() from dispatcher thread.")
+
+    now = time.monotonic()
+    reqs = dispatcher.enqueue_many(
+        [
+            (call[0], call[1], call[2], (now + call[3]) if len(call) > 3 and call[3] else None)
+            for call in calls
+        ],
+        want_reply=True,
+    )
+    logger.debug("Pipelined %d WAAPI calls", len(calls))
+
+    results: list = []
+    for call, req in zip(calls, reqs):
+        uri = call[0]
+        try:
+            status, data = req["reply_q"].get(timeout=timeout)
+        except queue.Empty:
+            logger.warning("WAAPI call timed out. URI: %s, timeout: %.3fs", uri, timeout)
+            status, data = "err", TimeoutError(f"WAAPI call to '{uri}' timed out after {timeout}s")
+        if status != "ok":
+            logger.error("WAAPI call failed. URI: %s, Error: %s", uri, str(data))
+        results.append(data)
+
+    if not return_exceptions:
+        for data in results:
+            if isinstance(data, BaseException):
+                raise data
+    return results
+
+
+class WaapiBatchResult:
+    """Placeholder returned by waapi_call() inside a WaapiBatch; filled in when the batch flushes."""
+
+    __slots__ = ("uri", "_status", "_data")
+
+    def __init__(self, uri: str):
+        self.uri = uri
+        self._status: str | None = None
+        self._data: Any = None
+
+    def done(self) -> bool:
+        return self._status is not None
+
+    def result(self) -> Any:
+        if self._status is None:
+            raise RuntimeError(f"WAAPI call to '{self.uri}' has not been flushed yet (batch still open).")
+        if self._status == "ok":
+            return self._data
+        raise self._data
+
+
+class WaapiBatch:
+    """
+    Group many waapi_call()s made on this thread into one dispatcher enqueue.
+
+        with WaapiBatch():
+            for gid, pos in positions:
+                set_game_obj_position(gid, pos)
+
+    - Inside the block, waapi_call() returns a WaapiBatchResult instead of the reply.
+    - On exit, all calls are pushed under a single queue lock and run back-to-back;
+      the results are then filled in and the first failure (if any) is re-raised.
+    - If the block raises, the queued calls are dropped.
+    WAAPI has no batch RPC, so each entry is still one call on the socket; the win is
+    one enqueue and one wake-up instead of a full caller round-trip per call.
+    Only use it for calls whose replies are not inspected inside the block.
+    """
+
+    def __init__(self, *, timeout: float = _DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self.calls: list[tuple[str, dict, dict | None, float | None, bool, WaapiBatchResult | None]] = []
+        self._outer: "WaapiBatch | None" = None
+
+    def __enter__(self) -> "WaapiBatch":
+        self._outer = getattr(_batch_tls, "batch", None)
+        _batch_tls.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        _batch_tls.batch = self._outer
+        calls, self.calls = self.calls, []
+        if exc_type is None and calls:
+            self._flush(calls)
+        return False
+
+    def _add(self, uri: str, args: dict, options: dict | None,
+             due_in: float | None, wait: bool) -> WaapiBatchResult | None:
+        result = WaapiBatchResult(uri) if wait else None
+        self.calls.append((uri, args, options, due_in, wait, result))
+        return result
+
+    def _flush(self, calls: list) -> None:
+        global _client, _dispatcher, _reconnecting
+
+        with _lock:
+            if _reconnecting:
+                raise ValueError(
+                    "WAAPI is reconnecting. Please retry in a moment."
+                )
+            
+            if _client is None or _dispatcher is None:
+                logger.error("WAAPI batch flush attempted before connection established (%d calls)", len(calls))
+                raise ValueError("WAAPI not connected. Call connect_to_waapi() first.")
+                    
+            dispatcher = _dispatcher
+
+            if not dispatcher.is_alive():
+                logger.error("WAAPI dispatcher thread is not running (%d calls)", len(calls))
+                raise ValueError("WAAPI dispatcher not running. Call connect_to_waapi() to restart.")
+
+        now = time.monotonic()
+        reqs = dispatcher.enqueue_many(
+            [(uri, args, options, (now + due_in) if due_in else None)
+             for uri, args, options, due_in, _, _ in calls],
+            # fire-and-forget entries get no reply queue and are not waited on
+            want_reply=[wait for _, _, _, _, wait, _ in calls],
+        )
+        logger.debug("WAAPI batch flushed (%d calls)", len(calls))
+
+        first_error: BaseException | None = None
+        for (uri, _, _, _, wait, result), req in zip(calls, reqs):
+            if not wait:
+                continue
+            try:
+                status, data = req["reply_q"].get(timeout=self.timeout)
+            except queue.Empty:
+                status, data = "err", TimeoutError(f"WAAPI call to '{uri}' timed out after {self.timeout}s")
+            if result is not None:
+                result._status, result._data = status, data
+            if status != "ok":
+                logger.error("WAAPI batched call failed. URI: %s, Error: %s", uri, str(data))
+                if first_error is None:
+                    first_error = data
+
+        if first_error is not None:
+            raise first_error
+
+
 def waapi_subscribe(uri: str, options: dict | None = None, *, timeout: float = _DEFAULT_TIMEOUT) -> str:
     """
     Subscribe to a WAAPI topic. Returns a subscription_id for use with
@@ -209,7 +499,7 @@ def connect_to_waapi():
         ValueError: If connection to the WAAPI server fails or already in progress
     """
 
-    global _client, _dispatcher, _reconnecting  
+    global _client, _dispatcher, _reconnecting, _generation
 
     # Phase 1: Mark as reconnecting and capture old resources
     with _lock:
@@ -259,6 +549,7 @@ def connect_to_waapi():
                 _client = new_client
                 _dispatcher = new_dispatcher
                 _reconnecting = False
+                _generation += 1
             
             logger.info("WAAPI reconnection completed successfully")
             
@@ -283,7 +574,39 @@ def connect_to_waapi():
         logger.error("WAAPI reconnection failed: %s", str(e), exc_info=True)
         raise
     
+def connection_generation() -> int:
+    """Counter bumped on every successful (re)connect; subscriptions do not survive a bump."""
+    with _lock:
+        return _generation
+
+def ensure_connected() -> bool:
+    """
+    Connect to WAAPI only if the current connection is missing or dead.
+
+    Returns True when an existing connection was reused, False when
+    connect_to_waapi() had to (re)establish one.
+    """
+
+    with _lock:
+        client = _client
+        dispatcher = _dispatcher
+        reconnecting = _reconnecting
+
+    if not reconnecting and client is not None and dispatcher is not None and dispatcher.is_alive():
+        try:
+            if client.is_connected():
+                return True
+        except Exception:
+            logger.debug("WAAPI client liveness check failed; reconnecting", exc_info=True)
+
+    connect_to_waapi()
+    return False
+
 def disconnect_from_wwise_client():
+    """
+    Tear down the WAAPI session. Only needed at shutdown: the connection is kept
+    for the process lifetime and re-established on demand (ensure_connected()).
+    """
     global _client, _dispatcher
     
     with _lock:
@@ -292,6 +615,10 @@ def disconnect_from_wwise_client():
         elif _client: 
             _client.disconnect()
 
+# The session is a process-wide singleton; close it cleanly on interpreter exit
+# rather than leaving the dispatcher thread and WAMP socket to be torn down.
+atexit.register(disconnect_from_wwise_client)
+
 # ==========================================================================================
 #                       Timed priority queue (MPSC -> single consumer)
 # ========================================================================================== 
@@ -333,6 +660,23 @@ class _TimedPQ:
             if len(self._pq) % 10 == 0 and len(self._pq) > 0:
                 logger.debug("TimedPQ depth: %d requests", len(self._pq))
 
+    def put_many(self, entries: list[tuple[float, _Req]]):
+        with self._cv:
+            current_size = len(self._pq)
+            if current_size + len(entries) > self._max_size:
+                raise WaapiQueueFullError(
+                f"WAAPI queue full ({self._max_size} requests)",
+                queue_size=current_size,  
+                max_size=self._max_size 
+            )
+            
+            for due_at, req in entries:
+                heapq.heappush(self._pq, (due_at, self._seq, req))
+                self._seq += 1
+            self._cv.notify()
+            
+            logger.debug("TimedPQ depth: %d requests (+%d batched)", len(self._pq), len(entries))
+
     def get_next_due(self, stop_flag: threading.Event) -> Optional[_Req]:
         with self._cv:
             while not stop_flag.is_set():  # Check stop flag each iteration
@@ -367,7 +711,7 @@ class WaapiDispatcher:
         self._thread: Optional[threading.Thread] = None
         self._client: Optional[WaapiClient] = client   # adopt here
         self._thread_id: Optional[int] = None
-        self._subscriptions: dict[str, tuple[EventHandler, queue.Queue]] = {}
+        self._subscriptions: dict[str, tuple[EventHandler, deque]] = {}
         self._subscription_lock = threading.Lock()
         logger.debug("WaapiDispatcher initialized")
 
@@ -433,6 +777,24 @@ class WaapiDispatcher:
         self._pq.put(req["due_at"], req)
         return req
 
+    def enqueue_many(self, calls: list[tuple[str, dict | None, dict | None, float | None]],
+                     *, want_reply: bool | list[bool] = False) -> list[_Req]:
+        """want_reply is one flag for every call, or one flag per call."""
+        now = time.monotonic()
+        wants = want_reply if isinstance(want_reply, list) else itertools.repeat(want_reply)
+        reqs: list[_Req] = [
+            {
+                "due_at": due_at if due_at is not None else now,
+                "uri": uri,
+                "args": args or {},
+                "options": options,
+                "reply_q": (queue.Queue(maxsize=1) if want else None),
+            }
+            for (uri, args, options, due_at), want in zip(calls, wants)
+        ]
+        self._pq.put_many([(req["due_at"], req) for req in reqs])
+        return reqs
+
     def enqueue_subscribe(self, uri: str, options: dict | None = None,
                           *, due_at: float | None = None) -> _Req:
         reply_q: queue.Queue = queue.Queue(maxsize=1)
@@ -461,24 +823,34 @@ class WaapiDispatcher:
 
     def get_subscription_events(self, subscription_id: str, max_count: int | None = None,
                                 clear: bool = True) -> list[dict[str, Any]]:
-        """Drain and return events for a subscription. Thread-safe."""
+        """Return up to max_count events for a subscription, draining them when clear is True. Thread-safe."""
+        if max_count is not None and max_count <= 0:
+            return []
         with self._subscription_lock:
             entry = self._subscriptions.get(subscription_id)
             if not entry:
                 return []
             _, event_q = entry
-        events: list[dict[str, Any]] = []
-        n = 0
-        limit = max_count if max_count is not None else (1 << 31)
-        while n < limit:
-            try:
-                ev = event_q.get_nowait()
-                events.append(ev)
-                n += 1
-            except queue.Empty:
-                break
+            if max_count is None or max_count >= len(event_q):
+                events = list(event_q)
+                if clear:
+                    event_q.clear()
+            else:
+                events = list(itertools.islice(event_q, max_count))
+                if clear:
+                    for _ in range(max_count):
+                        event_q.popleft()
         return events
 
+    def _make_event_sink(self, event_q: deque):
+        # Built per subscription so each callback keeps its own queue
+        # (a closure defined inside _run's loop would see only the latest one).
+        def _on_event(*args: Any, **kwargs: Any) -> None:
+            payload = kwargs if not args else {"args": list(args), "kwargs": kwargs}
+            with self._subscription_lock:
+                event_q.append(payload)
+        return _on_event
+
     def _run(self):
         self._thread_id = threading.get_ident()
         logger.info("WaapiDispatcher thread running (thread_id: %d)", self._thread_id)
@@ -500,14 +872,8 @@ class WaapiDispatcher:
                 try:
                     uri = req["uri"]
                     options = req.get("options") or {}
-                    event_q: queue.Queue = queue.Queue()
-                    def _on_event(*args: Any, **kwargs: Any) -> None:
-                        payload = kwargs if not args else {"args": list(args), "kwargs": kwargs}
-                        try:
-                            event_q.put(payload, block=False)
-                        except queue.Full:
-                            pass
-                    handler = self._client.subscribe(uri, _on_event, **options)
+                    event_q: deque = deque()
+                    handler = self._client.subscribe(uri, self._make_event_sink(event_q), **options)
                     sub_id = str(uuid.uuid4())
                     with self._subscription_lock:
                         self._subscriptions[sub_id] = (handler, event_q)
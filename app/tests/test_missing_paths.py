@@ -0,0 +1,65 @@
+"""
+A single unknown path passed to create_event / move_object_by_path must surface as
+WwiseObjectNotFoundError, not as a generic WwiseApiError.
+
+WAAPI is faked at the library's _waapi_read seam, so no Wwise instance is needed:
+
+    python -m unittest discover -s app/tests
+"""
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+import wwise_python_lib as WwisePythonLibrary
+from wwise_errors import WwiseObjectNotFoundError
+
+KNOWN_PATH = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Footsteps"
+EVENTS_PATH = "\\Events\\Default Work Unit"
+MISSING_PATH = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Missing"
+
+KNOWN_OBJECTS = {
+    KNOWN_PATH:  {"id": "{11111111-1111-1111-1111-111111111111}", "name": "Footsteps", "type": "Sound", "path": KNOWN_PATH},
+    EVENTS_PATH: {"id": "{22222222-2222-2222-2222-222222222222}", "name": "Default Work Unit", "type": "WorkUnit", "path": EVENTS_PATH},
+}
+
+
+def fake_waapi_read(uri, args, options=None, **kwargs):
+    """object.get over KNOWN_OBJECTS; like Wwise, rejects the request if any path is unknown."""
+    if uri != "ak.wwise.core.object.get":
+        raise AssertionError(f"unexpected WAAPI call {uri}")
+    paths = args["from"]["path"]
+    if any(path not in KNOWN_OBJECTS for path in paths):
+        raise WwisePythonLibrary.WaapiRequestFailed(
+            SimpleNamespace(error="ak.wwise.invalid_object", kwargs={"message": "Object not found"})
+        )
+    return {"return": [dict(KNOWN_OBJECTS[path]) for path in paths]}
+
+
+class MissingPathTests(unittest.TestCase):
+
+    def setUp(self):
+        WwisePythonLibrary.invalidate_object_caches()
+        for name, fake in (("_waapi_read", fake_waapi_read), ("_drain_object_changes", lambda: False)):
+            patcher = mock.patch.object(WwisePythonLibrary, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_get_objects_at_paths_omits_missing_path(self):
+        found = WwisePythonLibrary.get_objects_at_paths([KNOWN_PATH, MISSING_PATH])
+        self.assertEqual(list(found), [KNOWN_PATH])
+
+    def test_create_event_missing_source_is_not_found(self):
+        with self.assertRaises(WwiseObjectNotFoundError):
+            WwisePythonLibrary.create_event(MISSING_PATH, EVENTS_PATH, "play", "Play_Missing")
+
+    def test_move_object_by_path_missing_destination_is_not_found(self):
+        with self.assertRaises(WwiseObjectNotFoundError):
+            WwisePythonLibrary.move_object_by_path(KNOWN_PATH, MISSING_PATH)
+
+
+if __name__ == "__main__":
+    unittest.main()